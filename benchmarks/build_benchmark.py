@@ -0,0 +1,30 @@
+"""
+Builds a 13k×13k score matrix, every word against every word, into a
+memory-mapped file, and reports time and peak memory.
+
+    python -m benchmarks.build_benchmark [num_workers]
+"""
+
+import os
+import resource
+import sys
+import tempfile
+import time
+from wordle_tournaments_client import get_word_table
+from wordle_tournaments_client.score_matrix import build_score_file
+
+
+def main() -> None:
+    num_workers = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    letters = get_word_table().letters
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        codes = build_score_file(os.path.join(directory, "scores.npy"), letters, letters, num_workers=num_workers)
+        elapsed = time.perf_counter() - start
+        print(f"{codes.shape[0]}×{codes.shape[1]}, {codes.nbytes / 1e6:.0f} MB, "
+              f"{num_workers} workers: {elapsed:.2f} s, "
+              f"peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Compares ways of filtering every valid scrabble word by one scored guess.
+
+    python -m benchmarks.constraint_benchmark
+"""
+
+import timeit
+from solvers import is_eligible
+from wordle_tournaments_client import (
+    CandidateSet, Constraint, get_letter_index, get_valid_scrabble_words, get_word_table)
+
+guess, score = "crane", "wywgw"
+
+
+def main() -> None:
+    words = get_valid_scrabble_words()
+    table = get_word_table()
+    index = get_letter_index()
+    candidates = CandidateSet.from_words(table, words)
+    constraint = Constraint.from_score(guess, score)
+
+    results = {
+        "is_eligible": lambda: [w for w in words if is_eligible(w, guess, score)],
+        "Constraint.filter": lambda: Constraint.from_score(guess, score).filter(words),
+        "LetterIndex.filter": lambda: index.filter(candidates, Constraint.from_score(guess, score)),
+    }
+    expected = results["is_eligible"]()
+    assert constraint.filter(words) == expected
+    assert set(index.filter(candidates, constraint).words()) == set(expected)
+    for name, func in results.items():
+        number, total = timeit.Timer(func).autorange()
+        print(f"{name:20} {total / number * 1e3:8.3f} ms per filter of {len(words)} words")
+
+
+if __name__ == "__main__":
+    main()
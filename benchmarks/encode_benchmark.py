@@ -0,0 +1,31 @@
+"""
+Measures the cost of turning one CreateCompleteGameArgs into a request body.
+
+    python -m benchmarks.encode_benchmark
+"""
+
+import json
+import timeit
+from dataclasses import asdict
+from wordle_tournaments_client import (
+    CompleteGamesGuess, CreateCompleteGameArgs, _complete_game_args_to_dict, _encode_json, _load_orjson)
+
+
+def main() -> None:
+    for num_guesses in [6, 20]:
+        guesses = [CompleteGamesGuess("cigar", "wywgw", 100) for _ in range(num_guesses)]
+        args = CreateCompleteGameArgs("token", 1, 0, "cigar", 1, guesses)
+
+        candidates = {
+            "asdict + json.dumps": lambda: json.dumps(asdict(args)).encode("utf-8"),
+            "to_dict + _encode_json": lambda: _encode_json(_complete_game_args_to_dict(args)),
+        }
+        for name, encode in candidates.items():
+            number, total = timeit.Timer(encode).autorange()
+            print(f"{num_guesses:2} guesses  {name:24} {total / number * 1e6:8.2f} us/game")
+
+    print(f"orjson backend: {'yes' if _load_orjson() else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Measures how long it takes a fresh interpreter to import the package.
+
+    python -m benchmarks.import_benchmark
+"""
+
+import statistics
+import subprocess
+import sys
+from typing import List
+
+num_runs = 10
+
+cases = [
+    ("interpreter only", "pass"),
+    ("import package", "import wordle_tournaments_client"),
+    ("import Client", "from wordle_tournaments_client import Client"),
+    ("import word lists", "from wordle_tournaments_client import wordle_valid_words, scrabble_words"),
+]
+
+
+def time_import(statement: str) -> float:
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return float(out)
+
+
+def main() -> None:
+    for name, statement in cases:
+        times: List[float] = [time_import(statement) for _ in range(num_runs)]
+        print(f"{name:20} {statistics.median(times) * 1000:8.1f} ms (median of {num_runs})")
+
+
+if __name__ == "__main__":
+    main()
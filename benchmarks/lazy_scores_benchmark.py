@@ -0,0 +1,37 @@
+"""
+Filters every word of the vocabulary, which the full ScoreMatrix doesn't
+cover as solutions, by a few common guesses, with and without a
+LazyScoreMatrix of hot rows.
+
+    python -m benchmarks.lazy_scores_benchmark
+"""
+
+import timeit
+from wordle_tournaments_client import (
+    CandidateSet, LazyScoreMatrix, encode_score, filter_candidates, get_word_table)
+
+guesses = ["crane", "slate", "trace", "salet", "roate"]
+
+
+def main() -> None:
+    table = get_word_table()
+    candidates = CandidateSet(table, (1 << len(table)) - 1)
+    code = encode_score("wywww")
+    print(f"a dense {len(table)}×{len(table)} matrix would take {len(table) ** 2 / 1e6:.0f} MB")
+
+    for lazy in [None, LazyScoreMatrix(table, max_bytes=1 << 20)]:
+        def filter_all() -> None:
+            for guess in guesses:
+                filter_candidates(candidates, guess, code, lazy)
+
+        number, total = timeit.Timer(filter_all).autorange()
+        per_filter = total / number / len(guesses)
+        if lazy is None:
+            print(f"score_many:      {per_filter * 1e3:6.3f} ms/filter")
+        else:
+            print(f"LazyScoreMatrix: {per_filter * 1e3:6.3f} ms/filter, {lazy.nbytes / 1e3:.0f} kB of rows, "
+                  f"hits {lazy.hits}, misses {lazy.misses}, evictions {lazy.evictions}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Compares scoring one guess against every remaining candidate in a Python
+loop with the batched score_many().
+
+    python -m benchmarks.score_many_benchmark
+"""
+
+import timeit
+from wordle_tournaments_client import get_word_table, score_code, score_many
+
+
+def main() -> None:
+    table = get_word_table()
+    words = table.words
+    letters = table.letters
+
+    candidates = {
+        "score_code loop": lambda: [score_code("crane", w) for w in words],
+        "score_many(words)": lambda: score_many("crane", words),
+        "score_many(letters)": lambda: score_many("crane", letters),
+    }
+    for name, func in candidates.items():
+        number, total = timeit.Timer(func).autorange()
+        print(f"{name:20} {total / number * 1e3:8.3f} ms per {len(words)} scores")
+
+
+if __name__ == "__main__":
+    main()
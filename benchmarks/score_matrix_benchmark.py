@@ -0,0 +1,41 @@
+"""
+Times building the full guess×solution score matrix, loading it from the
+on-disk cache, and scoring through it compared with _score_guess.
+
+    python -m benchmarks.score_matrix_benchmark
+"""
+
+import tempfile
+import time
+import timeit
+from wordle_tournaments_client import _score_guess, get_word_table, score_code
+from wordle_tournaments_client.score_matrix import ScoreMatrix
+
+
+def main() -> None:
+    table = get_word_table()
+    start = time.perf_counter()
+    matrix = ScoreMatrix.build(table)
+    elapsed = time.perf_counter() - start
+    print(f"built {matrix.codes.shape[0]}×{matrix.codes.shape[1]} matrix, "
+          f"{matrix.nbytes / 1e6:.1f} MB, in {elapsed:.2f} s")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for attempt in ["cold", "warm"]:
+            start = time.perf_counter()
+            ScoreMatrix.load_or_build(table, cache_dir=cache_dir)
+            print(f"load_or_build, {attempt} cache: {time.perf_counter() - start:.3f} s")
+
+    candidates = {
+        "_score_guess": lambda: _score_guess("geese", "eerie"),
+        "score_code": lambda: score_code("geese", "eerie"),
+        "ScoreMatrix.score": lambda: matrix.score("geese", "eerie"),
+        "ScoreMatrix.code": lambda: matrix.code("geese", "eerie"),
+    }
+    for name, func in candidates.items():
+        number, total = timeit.Timer(func).autorange()
+        print(f"{name:20} {total / number * 1e6:8.2f} us/score")
+
+
+if __name__ == "__main__":
+    main()
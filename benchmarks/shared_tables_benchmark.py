@@ -0,0 +1,52 @@
+"""
+Starts a pool of spawned worker processes that each play a few games with
+the score matrix, once with every worker loading its own tables and once
+attached to tables shared by the parent.
+
+    python -m benchmarks.shared_tables_benchmark [num_workers]
+"""
+
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from wordle_tournaments_client import SharedScoreTables, get_score_matrix, use_shared_score_tables
+from wordle_tournaments_client.shared_tables import SharedTablesHandle
+
+
+def _play(seed: int) -> int:
+    from solvers import FixedStartingWordThenArbirarySolver
+    from wordle_tournaments_client import MemoryGameRunner, get_score_matrix, get_word_table
+
+    score_matrix = get_score_matrix()
+    solver = FixedStartingWordThenArbirarySolver("solar", score_matrix)
+    solution = get_word_table().words[seed]
+    return MemoryGameRunner(solution, solver, 10, score_matrix).play_game().num_guesses
+
+
+def _run(num_workers: int, handle: Optional[SharedTablesHandle]) -> float:
+    start = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    if handle:
+        executor = ProcessPoolExecutor(num_workers, context, use_shared_score_tables, (handle,))
+    else:
+        executor = ProcessPoolExecutor(num_workers, context)
+    with executor:
+        list(executor.map(_play, range(num_workers * 10)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    num_workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    score_matrix = get_score_matrix()
+    print(f"own tables:    {_run(num_workers, None):.2f} s")
+    with SharedScoreTables(score_matrix) as shared:
+        print(f"shared tables: {_run(num_workers, shared.handle):.2f} s")
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    print(f"largest worker peak RSS {children.ru_maxrss / 1e3:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Times solvers playing in-memory games against a sample of solutions.
+
+    python -m benchmarks.solver_benchmark
+"""
+
+import time
+from solvers import CharFreqSolver, FixedStartingWordThenArbirarySolver
+from wordle_tournaments_client import MemoryGameRunner, Solver, get_score_matrix, wordle_solution_words
+
+num_games = 100
+
+
+def _time_games(solver: Solver, score_matrix=None) -> float:
+    solutions = wordle_solution_words[::len(wordle_solution_words) // num_games][:num_games]
+    start = time.perf_counter()
+    for solution in solutions:
+        solver.reset()
+        MemoryGameRunner(solution, solver, 10, score_matrix).play_game()
+    return (time.perf_counter() - start) / len(solutions)
+
+
+def main() -> None:
+    score_matrix = get_score_matrix()
+    solvers = {
+        "CharFreqSolver": (CharFreqSolver(), None),
+        "FixedStartingWordThenArbirarySolver": (FixedStartingWordThenArbirarySolver("solar"), None),
+        "CharFreqSolver + matrix": (CharFreqSolver(score_matrix), score_matrix),
+        "FixedStartingWord... + matrix": (FixedStartingWordThenArbirarySolver("solar", score_matrix), score_matrix),
+    }
+    for name, (solver, matrix) in solvers.items():
+        per_game = _time_games(solver, matrix)
+        print(f"{name:36} {per_game * 1e3:8.2f} ms/game  {per_game * 2315:7.2f} s/tournament")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Measures tournament upload throughput against the in-process stand-in server.
+
+    python -m benchmarks.upload_benchmark
+"""
+
+import contextlib
+import io
+import time
+from typing import List, Tuple
+from wordle_tournaments_client import Client, PoolConfig, Solver, TournamentRunner
+from wordle_tournaments_client.stand_in_server import FaultConfig, StandInServer
+
+num_games = 200
+
+
+class FixedGuessSolver(Solver):
+    def get_guess(
+        self,
+        last_guess: str,
+        last_guess_valid: bool,
+        last_guess_score: str) -> Tuple[str, int]:
+        return "cigar", 1
+
+    def reset(self) -> None:
+        pass
+
+
+def run(faults: FaultConfig, pool_config: PoolConfig, num_upload_workers: int) -> Tuple[float, int]:
+    with StandInServer(faults=faults) as server:
+        runner = TournamentRunner(
+            FixedGuessSolver(), "token", "name", "description",
+            seed_start=0, seed_end=num_games - 1, max_num_turns=6,
+            client=Client("token", server.url, pool_config))
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            runner.play_tournament(num_upload_workers=num_upload_workers)
+        elapsed = time.perf_counter() - start
+
+        runner.client.close()
+        return elapsed, server.num_connections
+
+
+def main() -> None:
+    cases: List[Tuple[str, PoolConfig, int]] = [
+        ("no keep-alive", PoolConfig(keep_alive=False), 0),
+        ("pooled", PoolConfig(), 0),
+        ("pooled, 8 upload workers", PoolConfig(), 8),
+    ]
+    for latency in [0.0, 0.01]:
+        faults = FaultConfig(latency=latency)
+        for name, pool_config, num_upload_workers in cases:
+            elapsed, num_connections = run(faults, pool_config, num_upload_workers)
+            print(
+                f"latency {latency * 1000:3.0f}ms  {name:26} "
+                f"{num_games / elapsed:8.1f} games/s  {num_connections:4} connections")
+
+
+if __name__ == "__main__":
+    main()
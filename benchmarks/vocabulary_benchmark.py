@@ -0,0 +1,30 @@
+"""
+Measures the cost of the vocabulary accessors and of resetting a solver,
+which a tournament does once per game.
+
+    python -m benchmarks.vocabulary_benchmark
+"""
+
+import timeit
+from typing import Callable, Dict
+from solvers import CharFreqSolver, FixedStartingWordThenArbirarySolver
+from wordle_tournaments_client import get_valid_scrabble_words, get_valid_wordle_words
+
+
+def main() -> None:
+    char_freq_solver = CharFreqSolver()
+    fixed_solver = FixedStartingWordThenArbirarySolver("solar")
+    candidates: Dict[str, Callable[[], object]] = {
+        "get_valid_wordle_words()": get_valid_wordle_words,
+        "get_valid_scrabble_words()": get_valid_scrabble_words,
+        "CharFreqSolver.reset()": char_freq_solver.reset,
+        "FixedStartingWord...reset()": fixed_solver.reset,
+    }
+    for name, func in candidates.items():
+        number, total = timeit.Timer(func).autorange()
+        per_call = total / number
+        print(f"{name:30} {per_call * 1e6:10.2f} us/call  {per_call * 2315:8.3f} s/tournament")
+
+
+if __name__ == "__main__":
+    main()
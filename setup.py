@@ -17,5 +17,10 @@ setuptools.setup(
     },
     license='MIT',
     packages=['wordle_tournaments_client'],
+    package_data={'wordle_tournaments_client': ['data/*.bin']},
     install_requires=['requests'],
+    extras_require={
+        'orjson': ['orjson'],
+        'numpy': ['numpy'],
+    },
 )
@@ -1,7 +1,11 @@
 
+import functools
 from collections import Counter
-from typing import List, Dict, Tuple
-from wordle_tournaments_client import Solver, get_valid_scrabble_words, wordle_solution_words
+from typing import Dict, Optional, Tuple
+import numpy as np
+from wordle_tournaments_client import (
+    CandidateSet, ScoreSource, Solver, WordTable, encode_score, filter_candidates, get_valid_scrabble_words,
+    get_word_table)
 
 def is_eligible(word: str, guess: str, score: str) -> bool:
     word_char_freq = Counter(word)
@@ -45,24 +49,45 @@ def is_eligible(word: str, guess: str, score: str) -> bool:
     return True
 
 
+@functools.lru_cache(maxsize=1)
+def _all_candidates(table: WordTable) -> Tuple[CandidateSet, CandidateSet]:
+    # The scrabble words and the solutions of the given table.
+    return (
+        CandidateSet.from_flags(table, table.is_scrabble),
+        CandidateSet.from_flags(table, table.is_solution))
+
+
+@functools.lru_cache(maxsize=1)
+def _scrabble_order(table: WordTable) -> np.ndarray:
+    # The IDs of get_valid_scrabble_words() in list order, which is the
+    # order CharFreqSolver breaks ties in.
+    return table.ids_of(get_valid_scrabble_words())
+
+
 class CharFreqSolver(Solver):
-    eligible_words: List[str]
+    eligible_words: CandidateSet
+    score_matrix: Optional[ScoreSource]
     
-    def __init__(self) -> None:
-        self.eligible_words = get_valid_scrabble_words()
+    def __init__(self, score_matrix: Optional[ScoreSource] = None) -> None:
+        self.score_matrix = score_matrix
+        self.reset()
 
     def reset(self) -> None:
-        self.eligible_words = get_valid_scrabble_words()
+        self.eligible_words = _all_candidates(get_word_table())[0]
 
     def pick_word(self) -> str:
+        table = self.eligible_words.table
+        order = _scrabble_order(table)
+        eligible_words = [table.words[i] for i in order[self.eligible_words.flags()[order]]]
+
         char_counter: Counter[str] = Counter()
-        for word in self.eligible_words:
+        for word in eligible_words:
             char_counter.update(word)
 
         best_score = 0
         best_word = ""
 
-        for word in self.eligible_words:
+        for word in eligible_words:
             sum = 0
             for c in word:
                 sum += char_counter[c]
@@ -74,13 +99,10 @@ class CharFreqSolver(Solver):
         return best_word
 
     def filter_eligible_words(self, guess: str, score: str):
-        new_eligible_words: List[str] = []
+        self._filter(guess, encode_score(score))
 
-        for eligible_word in self.eligible_words:
-            if is_eligible(eligible_word, guess, score):
-                new_eligible_words.append(eligible_word)
-
-        self.eligible_words = new_eligible_words
+    def _filter(self, guess: str, code: int):
+        self.eligible_words = filter_candidates(self.eligible_words, guess, code, self.score_matrix)
 
 
     def get_guess(
@@ -89,33 +111,41 @@ class CharFreqSolver(Solver):
         last_word_valid: bool,
         last_word_score: str) -> Tuple[str, int]:
 
+        code = encode_score(last_word_score) if last_word_score else None
+        return self.get_guess_code(last_word, last_word_valid, code)
+
+    def get_guess_code(
+        self,
+        last_word: str,
+        last_word_valid: bool,
+        last_word_code: Optional[int]) -> Tuple[str, int]:
+
         if not last_word_valid:
             raise ValueError("last word was not valid")
 
-        if last_word:
-            self.filter_eligible_words(last_word, last_word_score)
+        if last_word and last_word_code is not None:
+            self._filter(last_word, last_word_code)
 
         return self.pick_word(), len(self.eligible_words)
 
 class FixedStartingWordThenArbirarySolver(Solver):
-    eligible_words: List[str]
+    eligible_words: CandidateSet
     starter_word: str
+    score_matrix: Optional[ScoreSource]
     
-    def __init__(self, starter_word: str) -> None:
-        self.eligible_words = wordle_solution_words
+    def __init__(self, starter_word: str, score_matrix: Optional[ScoreSource] = None) -> None:
         self.starter_word = starter_word
+        self.score_matrix = score_matrix
+        self.reset()
 
     def reset(self) -> None:
-        self.eligible_words = wordle_solution_words
+        self.eligible_words = _all_candidates(get_word_table())[1]
 
     def filter_eligible_words(self, guess: str, score: str):
-        new_eligible_words: List[str] = []
+        self._filter(guess, encode_score(score))
 
-        for eligible_word in self.eligible_words:
-            if is_eligible(eligible_word, guess, score):
-                new_eligible_words.append(eligible_word)
-
-        self.eligible_words = new_eligible_words
+    def _filter(self, guess: str, code: int):
+        self.eligible_words = filter_candidates(self.eligible_words, guess, code, self.score_matrix)
 
 
     def get_guess(
@@ -124,11 +154,20 @@ class FixedStartingWordThenArbirarySolver(Solver):
         last_word_valid: bool,
         last_word_score: str) -> Tuple[str, int]:
 
+        code = encode_score(last_word_score) if last_word_score else None
+        return self.get_guess_code(last_word, last_word_valid, code)
+
+    def get_guess_code(
+        self,
+        last_word: str,
+        last_word_valid: bool,
+        last_word_code: Optional[int]) -> Tuple[str, int]:
+
         if not last_word_valid:
-            self.eligible_words.remove(last_word)
+            self.eligible_words = self.eligible_words.without(last_word)
 
-        if last_word:
-            self.filter_eligible_words(last_word, last_word_score)
+        if last_word and last_word_code is not None:
+            self._filter(last_word, last_word_code)
 
         if len(self.eligible_words) == 0:
             raise ValueError("no eligible words left")
@@ -137,6 +176,6 @@ class FixedStartingWordThenArbirarySolver(Solver):
         if not last_word:
             return self.starter_word, len(self.eligible_words)
 
-        return self.eligible_words[0], len(self.eligible_words)
+        return self.eligible_words.first(), len(self.eligible_words)
 
 
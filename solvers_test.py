@@ -1,5 +1,10 @@
+import itertools
+import random
 from solvers import CharFreqSolver, is_eligible, FixedStartingWordThenArbirarySolver
-from wordle_tournaments_client import MemoryGameRunner
+from wordle_tournaments_client import (
+    CandidateSet, Constraint, LetterIndex, MemoryGameRunner, WordTable, _score_guess, encode_score,
+    filter_candidates, get_letter_index, get_score_matrix, get_valid_scrabble_words, get_word_table,
+    wordle_solution_words)
 
 def test_is_eligible():
     assert is_eligible("apple", 'aeaea', 'gywww')
@@ -31,4 +36,70 @@ def test_char_freq_solver_3():
     runner = MemoryGameRunner("proxy", solver, 10)
     result = runner.play_game()
     print(result)
-    assert result.won
\ No newline at end of file
+    assert result.won
+
+def test_fixed_starting_word_solver_does_not_change_word_list():
+    before = list(wordle_solution_words)
+
+    solver = FixedStartingWordThenArbirarySolver("bread")
+    solver.get_guess("", True, "")
+    solver.get_guess("cigar", False, "wwwww")
+    assert "cigar" not in solver.eligible_words
+    assert wordle_solution_words == before
+
+def test_letter_index_matches_is_eligible():
+    table = get_word_table()
+    index = get_letter_index()
+    rng = random.Random(0)
+    for _ in range(20):
+        guess, solution = rng.choice(table.words), rng.choice(table.words)
+        score = _score_guess(guess, solution)
+        assert index.matching(Constraint.from_score(guess, score)).words() == [
+            w for w in table.words if is_eligible(w, guess, score)]
+
+def test_constraint_matches_is_eligible():
+    words = list(get_valid_scrabble_words()[::40]) + ["sissy", "eerie", "civic", "mamma", "geese"]
+    index = LetterIndex(WordTable(words, [], []))
+    for guess in ["crane", "sissy", "eerie", "geese"]:
+        for score in map("".join, itertools.product("gyw", repeat=5)):
+            constraint = Constraint.from_score(guess, score)
+            expected = [w for w in words if is_eligible(w, guess, score)]
+            assert constraint.filter(words) == expected
+            assert [w for w in words if constraint.matches(w)] == expected
+            assert index.matching(constraint).words() == expected
+
+def test_filter_candidates_matches_is_eligible():
+    table = get_word_table()
+    score_matrix = get_score_matrix()
+    candidates = CandidateSet.from_flags(table, table.is_solution)
+    rng = random.Random(0)
+    for _ in range(20):
+        guess, solution = rng.choice(table.words), rng.choice(table.words[:2315])
+        score = _score_guess(guess, solution)
+        expected = [w for w in candidates if is_eligible(w, guess, score)]
+        assert filter_candidates(candidates, guess, encode_score(score)).words() == expected
+        assert filter_candidates(candidates, guess, encode_score(score), score_matrix).words() == expected
+
+def test_char_freq_solver_games():
+    games = {
+        "cigar": ["esses", "aalii", "briar", "invar", "cigar"],
+        "proxy": ["esses", "aalii", "rooty", "crony", "proxy"],
+        "enema": ["esses", "eerie", "etude", "enemy", "enema"],
+        "aroma": ["esses", "aalii", "agama", "aboma", "aroma"],
+    }
+    for score_matrix in [None, get_score_matrix()]:
+        for solution, guesses in games.items():
+            result = MemoryGameRunner(solution, CharFreqSolver(score_matrix), 10, score_matrix).play_game()
+            assert [guess for guess, _ in result.guesses] == guesses
+
+def test_fixed_starting_word_solver_games():
+    games = {
+        "cigar": ["solar", "cigar"],
+        "enema": ["solar", "awake", "heath", "enema"],
+        "mamma": ["solar", "awake", "gamma", "mamma"],
+    }
+    for score_matrix in [None, get_score_matrix()]:
+        for solution, guesses in games.items():
+            solver = FixedStartingWordThenArbirarySolver("solar", score_matrix)
+            result = MemoryGameRunner(solution, solver, 10, score_matrix).play_game()
+            assert [guess for guess, _ in result.guesses] == guesses
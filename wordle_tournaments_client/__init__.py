@@ -1,15 +1,33 @@
 __version__ = "0.0.3"
 
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, DefaultDict, Tuple, Set
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, DefaultDict, Tuple, Set, Union, TYPE_CHECKING
 from collections import defaultdict, Counter
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
-import requests
-from .wordle_solution_words import wordle_solution_words
-from .wordle_valid_words import wordle_valid_words
-from .scrabble_words import scrabble_words
+import functools
+import gzip
+import importlib
+import json
+import queue
+import random
+import threading
+import zlib
 from datetime import datetime
+from .patterns import all_green, decode_score, encode_score, score_code
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .spool import CircuitBreaker, GameJournal
+    from .letter_index import LetterIndex
+    from .score_matrix import ScoreMatrix, ScoreSource
+    from .word_table import WordTable
+
+    # Loaded on first access by __getattr__ below. Declared here so that type
+    # checkers see the lists rather than the submodules of the same names.
+    wordle_solution_words: List[str]
+    wordle_valid_words: List[str]
+    scrabble_words: List[str]
 
 default_server_url = "https://wordle-tournaments.vercel.app/api"
 
@@ -57,56 +75,282 @@ class Guess:
     status: int
 
 
-class Client:
-    base_url: str
-    auth_code: str
+@dataclass(frozen=True)
+class BatchUploadFailure:
+    # Position of the failed game in the list passed to create_complete_games.
+    index: int
+    args: CreateCompleteGameArgs
+    error: str
+
+
+@dataclass(frozen=True)
+class BatchUploadResult:
+    # One entry per uploaded game, in order. None where the upload failed.
+    games: List[Optional[Game]]
+    failures: List[BatchUploadFailure]
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    # Total number of tries, including the first one.
+    max_attempts: int = 5
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Seconds to wait after the given failed attempt (0 for the first),
+        using exponential backoff with full jitter.
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
 
-    def __init__(self, auth_code: str, url: str = default_server_url) -> None:
-        self.base_url = url
-        self.auth_code = auth_code
 
-    def create_user(self, name: str, description: str) -> User:
-        params = {
-            "auth_code": self.auth_code,
-            "name": name,
-            "description": description,
-        }
-        url = f"{self.base_url}/user"
-        resp = requests.post(url, params=params)
-        resp.raise_for_status()
-
-        json = resp.json()
-        return User(json["user_id"], json["description"])
-
-    def create_complete_game(self, args: CreateCompleteGameArgs) -> Game:
-        url = f"{self.base_url}/completegame"
-        args_dict = asdict(args)
-        resp = requests.post(url, json=args_dict)
-        resp.raise_for_status()
-
-        json = resp.json()
-        return Game(
-            game_id=json["game_id"], 
-            user_id=json["user_id"],
-            seed=json["seed"],
-            solution=json["solution"],
-            guesses=json["guesses"],
-            num_guesses=json["num_guesses"],
-            status=json["status"])
-
-
-def get_valid_wordle_words() -> Set[str]:
-    words = set()
-    for word in wordle_solution_words:
-        words.add(word)
-    for word in wordle_valid_words:
-        words.add(word)
+@dataclass(frozen=True)
+class PoolConfig:
+    # Number of per-host connection pools to cache.
+    num_pools: int = 10
+    # Maximum number of connections kept open to a single host.
+    max_connections_per_host: int = 10
+    # If true, callers wait for a free connection instead of opening a
+    # throwaway one once max_connections_per_host is reached.
+    block: bool = False
+    keep_alive: bool = True
+
+
+_compressors: Dict[Optional[str], Callable[[bytes], bytes]] = {
+    None: lambda data: data,
+    "gzip": gzip.compress,
+    "deflate": zlib.compress,
+}
+
+
+def _compress(data: bytes, compression: Optional[str]) -> bytes:
+    return _compressors[compression](data)
+
+
+def _idempotency_key(args: CreateCompleteGameArgs) -> str:
+    # A tournament uploads each seed once per user, so a retried upload of
+    # the same game carries the same key and is not stored twice.
+    return f"{args.user_id}-{args.seed}"
+
+
+def _complete_game_args_to_dict(args: CreateCompleteGameArgs) -> Dict:
+    # Same result as dataclasses.asdict, without its recursive deep copy.
+    return {
+        "auth_code": args.auth_code,
+        "user_id": args.user_id,
+        "seed": args.seed,
+        "solution": args.solution,
+        "status": args.status,
+        "guesses": [
+            {
+                "word": guess.word,
+                "score": guess.score,
+                "num_words_remaining": guess.num_words_remaining,
+            }
+            for guess in args.guesses
+        ],
+    }
+
+
+# Reusing one encoder avoids building a new one per call, as json.dumps does
+# whenever it is given options.
+_json_encoder = json.JSONEncoder(separators=(",", ":"))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_orjson() -> Any:
+    # Optional fast JSON backend, imported on first use.
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _encode_json(obj: Any) -> bytes:
+    orjson = _load_orjson()
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _json_encoder.encode(obj).encode("utf-8")
+
+
+def _batch_games_from_json(json: Any, num_games: int) -> List[Union[Game, str]]:
+    """
+    Parses a /completegames response into one Game or error message per
+    uploaded game. Raises ValueError if the response is malformed.
+    """
+
+    try:
+        results = json["results"]
+        if len(results) != num_games:
+            raise ValueError(f"expected {num_games} results, got {len(results)}")
+        return [
+            _game_from_json(result["game"]) if "game" in result else str(result["error"])
+            for result in results
+        ]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"malformed batch response: {e!r}")
+
+
+def _game_from_json(json: Dict) -> Game:
+    return Game(
+        game_id=json["game_id"], 
+        user_id=json["user_id"],
+        seed=json["seed"],
+        solution=json["solution"],
+        guesses=json["guesses"],
+        num_guesses=json["num_guesses"],
+        status=json["status"])
+
+
+# The word lists are big literal modules, and requests is slow to import and
+# only needed for talking to the server, so both are loaded on first access
+# through the module __getattr__ below (PEP 562).
+_word_list_names = ("wordle_solution_words", "wordle_valid_words", "scrabble_words")
+
+_lazy_attributes = {
+    "Client": ".client",
+    "AdaptiveLimiter": ".limiter",
+    "WordTable": ".word_table",
+    "CandidateSet": ".candidates",
+    "Constraint": ".constraint",
+    "LetterIndex": ".letter_index",
+    "ScoreMatrix": ".score_matrix",
+    "LazyScoreMatrix": ".score_matrix",
+    "ScoreSource": ".score_matrix",
+    "SharedScoreTables": ".shared_tables",
+    "attach_score_tables": ".shared_tables",
+    "use_shared_score_tables": ".shared_tables",
+    "score_many": ".score_matrix",
+    "score_pairs": ".score_matrix",
+    "filter_candidates": ".score_matrix",
+    # Zero-copy views of the packed word list files.
+    "wordle_solution_words_packed": ".wordle_solution_words",
+    "wordle_valid_words_packed": ".wordle_valid_words",
+    "scrabble_words_packed": ".scrabble_words",
+}
+
+
+def _load_word_list(name: str) -> List[str]:
+    module = importlib.import_module(f".{name}", __name__)
+    words: List[str] = getattr(module, name)
+    # Importing the submodule binds its name in this package to the module
+    # itself; rebind it to the list, as the package has always exported.
+    globals()[name] = words
     return words
 
 
-def get_valid_scrabble_words() -> List[str]:
+def __getattr__(name: str) -> Any:
+    if name in _word_list_names:
+        return _load_word_list(name)
+    if name in _lazy_attributes:
+        module = importlib.import_module(_lazy_attributes[name], __name__)
+        value = getattr(module, name)
+        # Importing a word list module binds its name to the module; unbind
+        # it, so that the name still loads the list on access.
+        list_name = module.__name__.rpartition(".")[2]
+        if list_name in _word_list_names and globals().get(list_name) is module:
+            del globals()[list_name]
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Words registered with register_valid_words(), on top of the built-in lists.
+_custom_valid_words: List[str] = []
+
+
+def register_valid_words(words: Iterable[str]) -> None:
+    """
+    Adds custom words to the dictionary returned by get_valid_wordle_words()
+    and get_valid_scrabble_words(), and invalidates their cached results.
+    """
+
+    new_words = list(words)
+    for word in new_words:
+        if len(word) != 5 or not word.isascii() or not word.isalpha() or not word.islower():
+            raise ValueError(f"{word!r} is not a 5 letter lowercase word")
+    _custom_valid_words.extend(new_words)
+    _clear_vocabulary_caches()
+
+
+def _clear_vocabulary_caches() -> None:
+    get_valid_wordle_words.cache_clear()
+    get_valid_scrabble_words.cache_clear()
+    get_word_table.cache_clear()
+    get_letter_index.cache_clear()
+    get_score_matrix.cache_clear()
+
+
+# Both are computed once per process, since solvers ask for them on every
+# reset. The results are immutable so that callers can't corrupt the cache.
+@functools.lru_cache(maxsize=None)
+def get_valid_wordle_words() -> FrozenSet[str]:
+    return frozenset(
+        _load_word_list("wordle_solution_words")
+        + _load_word_list("wordle_valid_words")
+        + _custom_valid_words)
+
+
+@functools.lru_cache(maxsize=None)
+def get_valid_scrabble_words() -> Tuple[str, ...]:
     valid_words_set = get_valid_wordle_words()
-    return [w for w in scrabble_words if w in valid_words_set]
+    return tuple(w for w in _load_word_list("scrabble_words") if w in valid_words_set)
+
+
+# Set in process-pool workers by shared_tables.use_shared_score_tables(), to
+# use the parent's tables instead of building their own.
+_shared_score_matrix: Optional["ScoreMatrix"] = None
+
+
+def _use_score_matrix(score_matrix: "ScoreMatrix") -> None:
+    global _shared_score_matrix
+    _shared_score_matrix = score_matrix
+    _clear_vocabulary_caches()
+
+
+@functools.lru_cache(maxsize=None)
+def get_word_table() -> "WordTable":
+    """
+    The WordTable of every known word, built once per process. Needs numpy.
+    """
+
+    if _shared_score_matrix is not None:
+        return _shared_score_matrix.table
+
+    from .word_table import WordTable
+    return WordTable(
+        _load_word_list("wordle_solution_words"),
+        _load_word_list("wordle_valid_words"),
+        _load_word_list("scrabble_words"),
+        _custom_valid_words)
+
+
+@functools.lru_cache(maxsize=None)
+def get_letter_index() -> "LetterIndex":
+    """
+    The LetterIndex of get_word_table(), built once per process.
+    """
+
+    from .letter_index import LetterIndex
+    return LetterIndex(get_word_table())
+
+
+@functools.lru_cache(maxsize=None)
+def get_score_matrix() -> "ScoreMatrix":
+    """
+    The ScoreMatrix of every valid word against every solution of
+    get_word_table(), ~30MB. It is built once, which takes a few seconds,
+    and then memory-mapped from the on-disk cache by every later process.
+    """
+
+    if _shared_score_matrix is not None:
+        return _shared_score_matrix
+
+    from .score_matrix import ScoreMatrix
+    return ScoreMatrix.load_or_build(get_word_table())
 
 
 class Solver(ABC):
@@ -118,36 +362,41 @@ class Solver(ABC):
         last_guess_score: str) -> Tuple[str, int]:
         pass 
 
+    def get_guess_code(
+        self,
+        last_guess: str,
+        last_guess_valid: bool,
+        last_guess_code: Optional[int]) -> Tuple[str, int]:
+        """
+        get_guess() with the score as a pattern code, or None before the
+        first guess. The runners call this; solvers that work with codes
+        can override it to skip building score strings.
+        """
+
+        last_guess_score = decode_score(last_guess_code) if last_guess_code is not None else ""
+        return self.get_guess(last_guess, last_guess_valid, last_guess_score)
+
     abstractmethod
     def reset(self):
         pass
 
 def _score_guess(guess: str, solution: str) -> str:
-    sol_char_counts = Counter(solution)
-    score = ["w"] * 5
-
-    for i, guess_c in enumerate(guess):
-        sol_c = solution[i]
+    return decode_score(score_code(guess, solution))
 
-        if sol_c == guess_c:
-            sol_char_counts.subtract(guess_c)
-            score[i] = "g"
 
-    for i, guess_c in enumerate(guess):
-        sol_c = solution[i]
+def _score_code_with(score_matrix: Optional["ScoreSource"], guess: str, solution: str) -> int:
+    # Looks the code up in score_matrix if it has the pair.
+    if score_matrix is not None:
+        try:
+            return score_matrix.code(guess, solution)
+        except KeyError:
+            pass
+    return score_code(guess, solution)
 
-        if sol_c == guess_c:
-            continue
-
-        if sol_char_counts[guess_c] > 0:
-            score[i] = "y"
-            sol_char_counts.subtract(guess_c)
-        
-    return "".join(score)
 
 class TournamentRunner:
     solver: Solver
-    client: Client
+    client: "Client"
     user_id: int
     seed_start: int
     seed_end: int
@@ -156,6 +405,9 @@ class TournamentRunner:
     wordle_solutions: List[str]
     user_description: str
     user_name: str
+    journal: Optional["GameJournal"]
+    circuit_breaker: "CircuitBreaker"
+    score_matrix: Optional["ScoreSource"]
 
     def __init__(
         self,
@@ -165,35 +417,233 @@ class TournamentRunner:
         user_description: str,
         server_url: Optional[str] = default_server_url,
         seed_start: int = 0,
-        seed_end: int = len(wordle_solution_words) - 1,
-        max_num_turns: int = 20) -> None:
+        seed_end: Optional[int] = None,
+        max_num_turns: int = 20,
+        journal_path: Optional[str] = None,
+        circuit_breaker: Optional["CircuitBreaker"] = None,
+        client: Optional["Client"] = None,
+        score_matrix: Optional["ScoreSource"] = None) -> None:
+        """
+        seed_end defaults to the last seed, len(wordle_solution_words) - 1.
+
+        If journal_path is given, every solved game is recorded there before
+        it is uploaded, which makes the tournament resumable. While the
+        circuit breaker is open, uploads are skipped and the games stay in
+        the journal.
+
+        Pass a client to control its pooling, retries, compression or rate
+        limiting; several runners can share one client, or clients sharing
+        one AdaptiveLimiter. server_url is ignored when a client is given.
+
+        With a score_matrix, such as get_score_matrix() or a LazyScoreMatrix,
+        guesses are scored by looking them up in it.
+        """
+
+        from .client import Client
+        from .spool import CircuitBreaker, GameJournal
 
         self.auth_code = auth_code
         self.solver = solver
         self.user_description = user_description
-        self.client = \
-            Client(auth_code, server_url) \
-            if server_url \
-            else Client(auth_code) 
+        if client is None:
+            client = \
+                Client(auth_code, server_url) \
+                if server_url \
+                else Client(auth_code)
+        self.client = client
         self.seed_start = seed_start
-        self.seed_end = seed_end
+        wordle_solution_words = _load_word_list("wordle_solution_words")
+        self.seed_end = len(wordle_solution_words) - 1 if seed_end is None else seed_end
         self.max_num_turns = max_num_turns
         self.wordle_solutions = wordle_solution_words.copy()
         self.user_name = user_name
-
-
-    def play_tournament(self) -> None:
+        self.journal = GameJournal(journal_path) if journal_path else None
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.score_matrix = score_matrix
+
+
+    def play_tournament(self, num_upload_workers: int = 0, upload_queue_size: int = 16) -> None:
+        """
+        Plays and uploads every game from seed_start to seed_end.
+
+        With num_upload_workers > 0, games are solved on the calling thread
+        while a pool of worker threads uploads the finished ones, so solving
+        and network round trips overlap. At most upload_queue_size solved
+        games wait for upload before solving pauses. Completed games are
+        still reported in order, and the first failed upload stops the
+        tournament and is re-raised once the workers have finished.
+
+        With a journal, failed uploads are left in the journal instead of
+        stopping the tournament; use resume() to upload them later.
+        """
+
+        if self.journal and self.journal.load().user_id is not None:
+            raise ValueError(f"journal {self.journal.path} already has a tournament, use resume()")
+
+        user_id = self._create_user()
+        self._play_games(
+            user_id,
+            range(self.seed_start, self.seed_end + 1),
+            num_upload_workers,
+            upload_queue_size)
+
+    def resume(self, num_upload_workers: int = 0, upload_queue_size: int = 16) -> None:
+        """
+        Continues the tournament recorded in the journal. Solved games that
+        were never acknowledged are uploaded again without being re-solved,
+        and only seeds that were never solved are played.
+        """
+
+        if not self.journal:
+            raise ValueError("resume() requires a journal")
+
+        state = self.journal.load(self.auth_code)
+        user_id = state.user_id if state.user_id is not None else self._create_user()
+
+        jobs: List[Union[CreateCompleteGameArgs, int]] = \
+            [args for _, args in sorted(state.pending.items())]
+        jobs.extend(
+            seed for seed in range(self.seed_start, self.seed_end + 1)
+            if seed not in state.pending and seed not in state.acknowledged)
+
+        self._play_games(user_id, jobs, num_upload_workers, upload_queue_size)
+
+    def _create_user(self) -> int:
         user = self.client.create_user(self.user_name, self.user_description)
-        user_id = user.user_id
+        if self.journal:
+            self.journal.record_user(user.user_id)
+        return user.user_id
 
-        for seed in range(self.seed_start, self.seed_end + 1):
-            args = self._play_game(user.user_id, seed)
+    def _play_games(
+        self,
+        user_id: int,
+        jobs: Iterable[Union[CreateCompleteGameArgs, int]],
+        num_upload_workers: int,
+        upload_queue_size: int) -> None:
+        """
+        Each job is either a seed to play, or an already solved game that only
+        needs uploading.
+        """
+
+        if num_upload_workers > 0:
+            self._play_games_pipelined(user_id, jobs, num_upload_workers, upload_queue_size)
+            return
+
+        for job in jobs:
+            args = self._solve(user_id, job)
+            self._report_game(args, self._upload(args))
+
+    def _play_games_pipelined(
+        self,
+        user_id: int,
+        jobs: Iterable[Union[CreateCompleteGameArgs, int]],
+        num_upload_workers: int,
+        upload_queue_size: int) -> None:
+
+        uploads: "queue.Queue[Optional[Tuple[int, CreateCompleteGameArgs]]]" = \
+            queue.Queue(upload_queue_size)
+        lock = threading.Lock()
+        errors: List[BaseException] = []
+        # Uploaded games waiting for earlier jobs to finish, so that
+        # completion is reported in order.
+        uploaded: Dict[int, Tuple[CreateCompleteGameArgs, Optional[Game]]] = {}
+        next_job_to_report = 0
+
+        def upload_worker() -> None:
+            nonlocal next_job_to_report
+
+            while True:
+                item = uploads.get()
+                if item is None:
+                    return
+                # After a failure, keep draining the queue so the solving
+                # thread never blocks on a full queue.
+                if errors:
+                    continue
+
+                job_index, args = item
+                try:
+                    game = self._upload(args)
+                except BaseException as e:
+                    with lock:
+                        errors.append(e)
+                    continue
+
+                with lock:
+                    uploaded[job_index] = (args, game)
+                    while next_job_to_report in uploaded:
+                        self._report_game(*uploaded.pop(next_job_to_report))
+                        next_job_to_report += 1
+
+        workers = [
+            threading.Thread(target=upload_worker, daemon=True)
+            for _ in range(num_upload_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            for job_index, job in enumerate(jobs):
+                if errors:
+                    break
+                uploads.put((job_index, self._solve(user_id, job)))
+        finally:
+            for _ in workers:
+                uploads.put(None)
+            for worker in workers:
+                worker.join()
+
+        if errors:
+            raise errors[0]
+
+    def _solve(self, user_id: int, job: Union[CreateCompleteGameArgs, int]) -> CreateCompleteGameArgs:
+        if isinstance(job, CreateCompleteGameArgs):
+            return job
+
+        args = self._play_game(user_id, job)
+        if self.journal:
+            self.journal.record_solved(args)
+        self.solver.reset()
+        return args
+
+    def _upload(self, args: CreateCompleteGameArgs) -> Optional[Game]:
+        """
+        Returns None if the game was left in the journal instead of uploaded.
+        """
+
+        if not self.journal:
+            return self.client.create_complete_game(args)
+
+        if not self.circuit_breaker.allow_request():
+            return None
+
+        import requests
+
+        try:
             game = self.client.create_complete_game(args)
-
-            print(f"completed game, {user_id =}, {seed =}, game_id = {game.game_id}, time = {datetime.now()}")
-
-            self.solver.reset()
-            
+        except (requests.ConnectionError, requests.Timeout):
+            self.circuit_breaker.record_failure()
+            return None
+        except requests.HTTPError as e:
+            # Only an unavailable or overloaded server is worth spooling for;
+            # a rejected game or auth code would be rejected again on resume.
+            status = e.response.status_code if e.response is not None else 0
+            if status < 500 and status != 429:
+                raise
+            self.circuit_breaker.record_failure()
+            return None
+
+        self.circuit_breaker.record_success()
+        self.journal.record_acknowledged(args.seed, game.game_id)
+        return game
+
+    def _report_game(self, args: CreateCompleteGameArgs, game: Optional[Game]) -> None:
+        user_id = args.user_id
+        seed = args.seed
+        if game is None:
+            print(f"spooled game, {user_id =}, {seed =}, time = {datetime.now()}")
+            return
+        print(f"completed game, {user_id =}, {seed =}, game_id = {game.game_id}, time = {datetime.now()}")
 
     def _play_game(self, user_id: int, seed: int) -> CreateCompleteGameArgs:
 
@@ -204,19 +654,20 @@ class TournamentRunner:
         won = False
 
         last_word_valid = True
-        last_word_score = ""
+        last_word_code: Optional[int] = None
         last_guess = ""
 
         while not won and num_guesses < self.max_num_turns:
             num_guesses += 1
 
-            guess, num_words_remaining = self.solver.get_guess(last_guess, last_word_valid, last_word_score)
+            guess, num_words_remaining = self.solver.get_guess_code(last_guess, last_word_valid, last_word_code)
             last_guess = guess
-            last_word_score = _score_guess(guess, solution)
+            last_word_code = _score_code_with(self.score_matrix, guess, solution)
             if len(guesses) > 0:
                 guesses[-1].num_words_remaining = num_words_remaining
-            guesses.append(CompleteGamesGuess(guess, last_word_score, 0))
-            won = last_word_score == "ggggg"
+            # The upload API takes score strings.
+            guesses.append(CompleteGamesGuess(guess, decode_score(last_word_code), 0))
+            won = last_word_code == all_green
 
         status = 1 if won else 2
         return CreateCompleteGameArgs(
@@ -228,6 +679,8 @@ class GameResult:
     won: bool
     num_guesses: int
     guesses: List[Tuple[str, str]]
+    # The pattern code of each guess's score.
+    score_codes: List[int] = field(default_factory=list)
 
 
 class MemoryGameRunner:
@@ -236,11 +689,18 @@ class MemoryGameRunner:
     max_num_guesses: int
     letter_info: DefaultDict[str, List[int]]
     guesses: List[Tuple[str, str]]
+    score_matrix: Optional["ScoreSource"]
 
-    def __init__(self, solution: str, solver: Solver, max_num_guesses: int = 100):
+    def __init__(
+        self,
+        solution: str,
+        solver: Solver,
+        max_num_guesses: int = 100,
+        score_matrix: Optional["ScoreSource"] = None):
         self.solution = solution
         self.solver = solver
         self.max_num_guesses = max_num_guesses
+        self.score_matrix = score_matrix
         self.letter_info = defaultdict(list)
         self.guesses = []
     
@@ -249,20 +709,25 @@ class MemoryGameRunner:
         won = False
 
         last_word_valid = True
-        last_word_score = ""
+        last_word_code: Optional[int] = None
         last_guess = ""
+        codes: List[int] = []
 
         while not won and num_guesses < self.max_num_guesses:
             num_guesses += 1
 
-            guess, _ = self.solver.get_guess(last_guess, last_word_valid, last_word_score)
+            guess, _ = self.solver.get_guess_code(last_guess, last_word_valid, last_word_code)
             last_guess = guess
-            last_word_score = self._score_guess(guess)
-            self.guesses.append((guess, last_word_score))
-            won = last_word_score == "ggggg"
+            last_word_code = self._score_code(guess)
+            codes.append(last_word_code)
+            self.guesses.append((guess, decode_score(last_word_code)))
+            won = last_word_code == all_green
 
-        return GameResult(won, num_guesses, self.guesses)
+        return GameResult(won, num_guesses, self.guesses, codes)
 
 
     def _score_guess(self, guess: str) -> str:
-        return _score_guess(guess, self.solution)
+        return decode_score(self._score_code(guess))
+
+    def _score_code(self, guess: str) -> int:
+        return _score_code_with(self.score_matrix, guess, self.solution)
@@ -0,0 +1,77 @@
+import mmap
+import os
+from typing import Iterable, Iterator, List, Optional
+
+word_length = 5
+
+_data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+class PackedWordList:
+    """
+    A read-only word list stored as fixed-width, 5 bytes per word, ASCII,
+    with no separators.
+
+    The file is memory-mapped, so `buffer` is a zero-copy view of it that
+    every process mapping the same file shares through the page cache.
+    Python strs are only built by words(), once, or per item on indexing.
+    """
+
+    path: str
+    buffer: memoryview
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            # mmap refuses empty files.
+            if os.fstat(f.fileno()).st_size:
+                self.buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                self.buffer = memoryview(b"")
+        if len(self.buffer) % word_length:
+            raise ValueError(f"{path} is not a whole number of {word_length}-byte words")
+        self._words: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self.buffer) // word_length
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("word index out of range")
+        start = i * word_length
+        return bytes(self.buffer[start:start + word_length]).decode("ascii")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words())
+
+    def words(self) -> List[str]:
+        """
+        The words as a list of str, decoded on the first call.
+        """
+
+        if self._words is None:
+            text = bytes(self.buffer).decode("ascii")
+            self._words = [text[i:i + word_length] for i in range(0, len(text), word_length)]
+        return self._words
+
+
+def load_packed_words(name: str) -> PackedWordList:
+    return PackedWordList(os.path.join(_data_dir, f"{name}.bin"))
+
+
+def pack_words(words: Iterable[str], path: str) -> None:
+    """
+    Writes words in the format read by PackedWordList.
+    """
+
+    data = bytearray()
+    for word in words:
+        encoded = word.encode("ascii")
+        if len(encoded) != word_length:
+            raise ValueError(f"{word!r} is not {word_length} letters long")
+        data += encoded
+
+    with open(path, "wb") as f:
+        f.write(data)
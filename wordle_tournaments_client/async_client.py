@@ -0,0 +1,311 @@
+import asyncio
+import json
+import ssl
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+from . import (
+    CreateCompleteGameArgs, Game, RetryPolicy, User, default_server_url,
+    _complete_game_args_to_dict, _compress, _compressors, _encode_json,
+    _game_from_json, _idempotency_key)
+
+
+class HTTPStatusError(Exception):
+    status: int
+    body: bytes
+
+    def __init__(self, status: int, url: str, body: bytes) -> None:
+        super().__init__(f"{status} error for url: {url}")
+        self.status = status
+        self.body = body
+
+
+class _Connection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        self.writer.close()
+
+    async def request(
+        self,
+        host: str,
+        path: str,
+        body: bytes,
+        headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes, bool]:
+        """
+        Sends a POST request and reads the response. Returns the status, the
+        headers (with lowercase names), the body and whether the connection
+        can be reused.
+        """
+
+        head = [
+            f"POST {path} HTTP/1.1",
+            f"Host: {host}",
+            f"Content-Length: {len(body)}",
+            "Accept: application/json",
+        ]
+        head.extend(f"{name}: {value}" for name, value in headers.items())
+        self.writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readuntil(b"\r\n")
+        # The reason phrase is optional, as in "HTTP/1.1 200".
+        version, status = status_line.decode("latin-1").split(" ", 2)[:2]
+
+        resp_headers: Dict[str, str] = {}
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            resp_headers[name.strip().lower()] = value.strip()
+
+        keep_alive = \
+            resp_headers.get("connection", "").lower() != "close" \
+            and version != "HTTP/1.0"
+
+        if resp_headers.get("transfer-encoding", "").lower() == "chunked":
+            resp_body = await self._read_chunked()
+        elif "content-length" in resp_headers:
+            resp_body = await self.reader.readexactly(int(resp_headers["content-length"]))
+        else:
+            resp_body = await self.reader.read()
+            keep_alive = False
+
+        return int(status), resp_headers, resp_body, keep_alive
+
+    async def _read_chunked(self) -> bytes:
+        chunks: List[bytes] = []
+        while True:
+            size_line = await self.reader.readuntil(b"\r\n")
+            size = int(size_line.split(b";", 1)[0], 16)
+            if size == 0:
+                # Skip trailers.
+                while await self.reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+
+class AsyncClient:
+    """
+    asyncio counterpart of Client.
+
+    At most max_in_flight requests are outstanding at once, and the
+    connections they use are kept alive and reused, so uploading thousands of
+    games needs no more than max_in_flight sockets.
+    """
+
+    base_url: str
+    auth_code: str
+    max_in_flight: int
+    retry_policy: RetryPolicy
+    timeout: Optional[float]
+    compression: Optional[str]
+
+    def __init__(
+        self,
+        auth_code: str,
+        url: str = default_server_url,
+        max_in_flight: int = 10,
+        retry_policy: RetryPolicy = RetryPolicy(),
+        timeout: Optional[float] = 30.0,
+        compression: Optional[str] = None) -> None:
+
+        if compression not in _compressors:
+            raise ValueError(f"unsupported compression {compression!r}")
+
+        self.base_url = url
+        self.auth_code = auth_code
+        self.max_in_flight = max_in_flight
+        self.retry_policy = retry_policy
+        self.timeout = timeout
+        self.compression = compression
+
+        parts = urlsplit(url)
+        self._scheme = parts.scheme
+        self._hostname = parts.hostname or ""
+        self._port = parts.port or (443 if parts.scheme == "https" else 80)
+        self._host_header = parts.netloc
+        self._base_path = parts.path.rstrip("/")
+        self._idle: List[_Connection] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def create_user(self, name: str, description: str) -> User:
+        params = {
+            "auth_code": self.auth_code,
+            "name": name,
+            "description": description,
+        }
+        resp = await self._post(f"/user?{urlencode(params)}", b"", {}, idempotent=False)
+        return User(resp["user_id"], resp["description"])
+
+    async def create_complete_game(self, args: CreateCompleteGameArgs) -> Game:
+        body = _encode_json(_complete_game_args_to_dict(args))
+        headers = {
+            "Content-Type": "application/json",
+            "Idempotency-Key": _idempotency_key(args),
+        }
+
+        # Same negotiation as Client._post_json.
+        compression = self.compression
+        if compression:
+            compressed_headers = dict(headers, **{"Content-Encoding": compression})
+            try:
+                return _game_from_json(await self._post(
+                    "/completegame", _compress(body, compression), compressed_headers, idempotent=True))
+            except HTTPStatusError as e:
+                if e.status != 415:
+                    raise
+                self.compression = None
+
+        return _game_from_json(await self._post("/completegame", body, headers, idempotent=True))
+
+    async def upload_many(self, args_iterable: Iterable[CreateCompleteGameArgs]) -> List[Game]:
+        """
+        Uploads every game in args_iterable, keeping up to max_in_flight
+        uploads running. The iterable is consumed lazily. Returns the games in
+        the same order as the args. The first failed upload cancels the rest
+        and is re-raised.
+        """
+
+        items = enumerate(args_iterable)
+        results: Dict[int, Game] = {}
+
+        async def worker() -> None:
+            for i, args in items:
+                results[i] = await self.create_complete_game(args)
+
+        tasks = [asyncio.ensure_future(worker()) for _ in range(self.max_in_flight)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        return [results[i] for i in range(len(results))]
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+        for conn in idle:
+            try:
+                await conn.writer.wait_closed()
+            except (ConnectionError, ssl.SSLError):
+                pass
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _post(
+        self,
+        path: str,
+        body: bytes,
+        headers: Dict[str, str],
+        idempotent: bool) -> Dict:
+        """
+        POSTs with the same retry rules as Client._post. Each attempt is
+        bounded by timeout.
+        """
+
+        # Created lazily so the semaphore binds to the running event loop.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+
+        full_path = self._base_path + path
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            last_attempt = attempt >= policy.max_attempts - 1
+            try:
+                async with self._semaphore:
+                    status, resp_headers, resp_body = await asyncio.wait_for(
+                        self._send(full_path, body, headers, idempotent), self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+                if last_attempt or not idempotent:
+                    raise
+                await asyncio.sleep(policy.backoff(attempt))
+                attempt += 1
+                continue
+
+            retryable = \
+                status in policy.retry_statuses \
+                and (idempotent or status == 429)
+            if last_attempt or not retryable:
+                break
+
+            await asyncio.sleep(max(policy.backoff(attempt), _retry_after(resp_headers)))
+            attempt += 1
+
+        if status >= 400:
+            raise HTTPStatusError(status, f"{self.base_url}{path}", resp_body)
+        return json.loads(resp_body)
+
+    async def _send(
+        self,
+        path: str,
+        body: bytes,
+        headers: Dict[str, str],
+        idempotent: bool) -> Tuple[int, Dict[str, str], bytes]:
+
+        while self._idle:
+            conn = self._idle.pop()
+            # Skip idle connections the server is known to have closed.
+            if conn.reader.at_eof():
+                conn.close()
+                continue
+            try:
+                return await self._send_on(conn, path, body, headers)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # The server may have closed the connection just as the
+                # request was sent, and may or may not have acted on it, so
+                # only idempotent requests are replayed on another one.
+                if not idempotent:
+                    raise
+
+        conn = await self._connect()
+        return await self._send_on(conn, path, body, headers)
+
+    async def _send_on(
+        self,
+        conn: _Connection,
+        path: str,
+        body: bytes,
+        headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+
+        try:
+            status, resp_headers, resp_body, keep_alive = \
+                await conn.request(self._host_header, path, body, headers)
+        except BaseException:
+            conn.close()
+            raise
+
+        if keep_alive:
+            self._idle.append(conn)
+        else:
+            conn.close()
+        return status, resp_headers, resp_body
+
+    async def _connect(self) -> _Connection:
+        ssl_context = ssl.create_default_context() if self._scheme == "https" else None
+        reader, writer = await asyncio.open_connection(
+            self._hostname, self._port, ssl=ssl_context)
+        return _Connection(reader, writer)
+
+
+def _retry_after(headers: Dict[str, str]) -> float:
+    try:
+        return float(headers.get("retry-after", 0))
+    except ValueError:
+        return 0.0
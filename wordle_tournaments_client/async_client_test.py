@@ -0,0 +1,133 @@
+import asyncio
+import pytest
+from . import CompleteGamesGuess, CreateCompleteGameArgs, RetryPolicy
+from .async_client import AsyncClient, HTTPStatusError
+from .stand_in_server import StandInServer
+
+
+def _game_args(user_id: int, seed: int) -> CreateCompleteGameArgs:
+    guesses = [CompleteGamesGuess("cigar", "ggggg", 0)]
+    return CreateCompleteGameArgs("token", user_id, seed, "cigar", 1, guesses)
+
+
+def test_async_client_upload_many():
+    async def run(url: str):
+        async with AsyncClient("token", url, max_in_flight=3) as client:
+            user = await client.create_user("name", "description")
+            assert user.description == "description"
+            return await client.upload_many(_game_args(user.user_id, seed) for seed in range(50))
+
+    with StandInServer() as server:
+        games = asyncio.run(run(server.url))
+
+        assert [g.seed for g in games] == list(range(50))
+        assert len(server.games) == 50
+        assert server.num_connections <= 3
+
+
+def test_async_client_upload_many_error():
+    async def run(url: str):
+        async with AsyncClient("token", url, max_in_flight=2) as client:
+            # No user with this ID exists, so the server rejects the upload.
+            await client.upload_many([_game_args(1234, 0)])
+
+    with StandInServer() as server:
+        with pytest.raises(HTTPStatusError) as exc_info:
+            asyncio.run(run(server.url))
+        assert exc_info.value.status == 400
+
+
+def test_async_client_retries_uploads():
+    async def run(url: str):
+        retry_policy = RetryPolicy(max_attempts=3, backoff_base=0.001)
+        async with AsyncClient("token", url, retry_policy=retry_policy) as client:
+            user = await client.create_user("name", "description")
+            server.state.scripted_failures = [502, 429]
+            first = await client.create_complete_game(_game_args(user.user_id, 0))
+            second = await client.create_complete_game(_game_args(user.user_id, 0))
+            return first, second
+
+    with StandInServer() as server:
+        first, second = asyncio.run(run(server.url))
+
+        assert first == second
+        assert len(server.games) == 1
+        assert server.num_requests == 5
+
+
+def test_async_client_compresses_uploads():
+    async def run(url: str):
+        async with AsyncClient("token", url, compression="gzip") as client:
+            user = await client.create_user("name", "description")
+            return await client.upload_many(_game_args(user.user_id, seed) for seed in range(5))
+
+    with StandInServer() as server:
+        games = asyncio.run(run(server.url))
+
+        assert [g.seed for g in games] == list(range(5))
+        assert server.num_requests == 6
+
+
+async def _serve_raw(handle_request):
+    """
+    Starts a bare HTTP server on localhost. handle_request(n) gets the number
+    of the request on its connection and returns the raw response, or None to
+    close the connection without answering.
+    """
+
+    async def handle(reader, writer):
+        n = 0
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                break
+            length = [
+                int(line.split(b":")[1]) for line in head.split(b"\r\n")
+                if line.lower().startswith(b"content-length")
+            ][0]
+            await reader.readexactly(length)
+            n += 1
+            resp = handle_request(n)
+            if resp is None:
+                break
+            writer.write(resp)
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}/api"
+
+
+_user_response = \
+    b'HTTP/1.1 200\r\nContent-Length: 37\r\n\r\n{"user_id": 1, "description": "desc"}'
+
+
+def test_async_client_status_line_without_reason():
+    async def run():
+        server, url = await _serve_raw(lambda n: _user_response)
+        async with server, AsyncClient("token", url) as client:
+            return await client.create_user("name", "desc")
+
+    assert asyncio.run(run()).user_id == 1
+
+
+def test_async_client_does_not_replay_create_user():
+    num_requests = 0
+
+    def handle_request(n):
+        nonlocal num_requests
+        num_requests += 1
+        # The second request on a connection is dropped unanswered.
+        return _user_response if n == 1 else None
+
+    async def run():
+        server, url = await _serve_raw(handle_request)
+        async with server, AsyncClient("token", url) as client:
+            await client.create_user("name", "desc")
+            with pytest.raises((ConnectionError, asyncio.IncompleteReadError)):
+                await client.create_user("name", "desc")
+
+    asyncio.run(run())
+    assert num_requests == 2
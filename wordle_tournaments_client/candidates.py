@@ -0,0 +1,115 @@
+from typing import Callable, Iterable, Iterator, List, Union
+import numpy as np
+from .word_table import WordTable
+
+
+class CandidateSet:
+    """
+    An immutable set of words of a WordTable, stored as a bitset over word
+    IDs in a Python int: bit i is set if word i is in the set.
+
+    Intersection, union and difference work a machine word at a time, and
+    since sets are never modified, keeping a snapshot of one is free.
+    Iteration is in word ID order.
+    """
+
+    __slots__ = ("table", "bits")
+
+    table: WordTable
+    bits: int
+
+    def __init__(self, table: WordTable, bits: int = 0) -> None:
+        self.table = table
+        self.bits = bits
+
+    @classmethod
+    def from_flags(cls, table: WordTable, flags: np.ndarray) -> "CandidateSet":
+        """
+        The set of words i for which flags[i] is true.
+        """
+
+        packed = np.packbits(np.asarray(flags, dtype=bool), bitorder="little")
+        return cls(table, int.from_bytes(packed.tobytes(), "little"))
+
+    @classmethod
+    def from_ids(cls, table: WordTable, ids: Iterable[int]) -> "CandidateSet":
+        flags = np.zeros(len(table), dtype=bool)
+        flags[ids if isinstance(ids, np.ndarray) else np.fromiter(ids, dtype=np.intp)] = True
+        return cls.from_flags(table, flags)
+
+    @classmethod
+    def from_words(cls, table: WordTable, words: Iterable[str]) -> "CandidateSet":
+        return cls.from_ids(table, (table.id_of(word) for word in words))
+
+    def flags(self) -> np.ndarray:
+        """
+        A bool array with one element per word of the table.
+        """
+
+        data = self.bits.to_bytes((len(self.table) + 7) // 8, "little")
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder="little")
+        return bits[:len(self.table)].astype(bool)
+
+    def ids(self) -> np.ndarray:
+        return np.flatnonzero(self.flags())
+
+    def words(self) -> List[str]:
+        words = self.table.words
+        return [words[i] for i in self.ids()]
+
+    def first(self) -> str:
+        """
+        The word with the lowest ID. Raises ValueError if the set is empty.
+        """
+
+        if not self.bits:
+            raise ValueError("empty candidate set")
+        return self.table.words[(self.bits & -self.bits).bit_length() - 1]
+
+    def without(self, word: str) -> "CandidateSet":
+        return CandidateSet(self.table, self.bits & ~(1 << self.table.id_of(word)))
+
+    def filter(self, predicate: Callable[[str], bool]) -> "CandidateSet":
+        words = self.table.words
+        return CandidateSet.from_ids(self.table, (i for i in self.ids() if predicate(words[i])))
+
+    def _other_bits(self, other: "CandidateSet") -> int:
+        if other.table is not self.table:
+            raise ValueError("candidate sets are over different word tables")
+        return other.bits
+
+    def __and__(self, other: "CandidateSet") -> "CandidateSet":
+        return CandidateSet(self.table, self.bits & self._other_bits(other))
+
+    def __or__(self, other: "CandidateSet") -> "CandidateSet":
+        return CandidateSet(self.table, self.bits | self._other_bits(other))
+
+    def __sub__(self, other: "CandidateSet") -> "CandidateSet":
+        return CandidateSet(self.table, self.bits & ~self._other_bits(other))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CandidateSet):
+            return NotImplemented
+        return self.table is other.table and self.bits == other.bits
+
+    def __hash__(self) -> int:
+        return hash(self.bits)
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __contains__(self, word: Union[str, int]) -> bool:
+        if isinstance(word, str):
+            if word not in self.table:
+                return False
+            word = self.table.id_of(word)
+        return bool(self.bits >> word & 1)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words())
+
+    def __repr__(self) -> str:
+        return f"CandidateSet({len(self)} words)"
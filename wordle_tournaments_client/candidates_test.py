@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from .candidates import CandidateSet
+from .word_table import WordTable
+
+
+@pytest.fixture
+def table() -> WordTable:
+    return WordTable(["cigar", "rebut", "sissy"], ["aahed", "zonal"], [])
+
+
+def test_candidate_set(table):
+    evens = CandidateSet.from_ids(table, [0, 2, 4])
+    low = CandidateSet.from_words(table, ["cigar", "rebut", "sissy"])
+
+    assert evens.bits == 0b10101
+    assert evens.words() == ["cigar", "sissy", "zonal"]
+    assert list(low) == ["cigar", "rebut", "sissy"]
+    assert (evens & low).words() == ["cigar", "sissy"]
+    assert (evens | low).ids().tolist() == [0, 1, 2, 4]
+    assert (low - evens).words() == ["rebut"]
+    assert len(evens) == 3
+    assert "zonal" in evens and 4 in evens
+    assert "rebut" not in evens and "bread" not in evens
+    assert evens.flags().tolist() == [True, False, True, False, True]
+
+
+def test_candidate_set_updates_return_new_sets(table):
+    words = CandidateSet.from_flags(table, table.is_solution)
+    snapshot = words
+
+    words = words.without("cigar")
+    assert words.first() == "rebut"
+    assert snapshot.first() == "cigar"
+    assert words.filter(lambda word: word.startswith("s")).words() == ["sissy"]
+
+    empty = CandidateSet(table)
+    assert not empty
+    with pytest.raises(ValueError):
+        empty.first()
+
+
+def test_candidate_sets_over_different_tables(table):
+    other = WordTable(["cigar"], [], [])
+    with pytest.raises(ValueError):
+        CandidateSet(table, 1) & CandidateSet(other, 1)
+
+
+def test_candidate_set_over_many_words():
+    table = WordTable([f"{a}{b}{c}aa" for a in "abcd" for b in "abcdefghij" for c in "abcdefghij"], [], [])
+    flags = np.arange(len(table)) % 3 == 0
+    words = CandidateSet.from_flags(table, flags)
+
+    assert len(words) == flags.sum()
+    assert words.ids().tolist() == np.flatnonzero(flags).tolist()
@@ -0,0 +1,223 @@
+import threading
+import time
+from typing import Dict, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from . import (
+    BatchUploadFailure, BatchUploadResult, CreateCompleteGameArgs, Game, PoolConfig,
+    RetryPolicy, User, default_server_url,
+    _batch_games_from_json, _complete_game_args_to_dict, _compress, _compressors,
+    _encode_json, _game_from_json, _idempotency_key)
+from .limiter import AdaptiveLimiter
+
+
+class Client:
+    base_url: str
+    auth_code: str
+    pool_config: PoolConfig
+    retry_policy: RetryPolicy
+    timeout: Optional[float]
+    compression: Optional[str]
+    limiter: Optional[AdaptiveLimiter]
+
+    def __init__(
+        self,
+        auth_code: str,
+        url: str = default_server_url,
+        pool_config: PoolConfig = PoolConfig(),
+        retry_policy: RetryPolicy = RetryPolicy(),
+        timeout: Optional[float] = 30.0,
+        compression: Optional[str] = None,
+        limiter: Optional[AdaptiveLimiter] = None) -> None:
+        """
+        timeout is the number of seconds each HTTP call may spend connecting
+        or waiting for the server before it fails and, if allowed, is retried.
+
+        compression is "gzip", "deflate" or None, and applies to the bodies
+        of game uploads.
+
+        If a limiter is given, every HTTP call made through this client,
+        from any thread, waits for it, and it adapts to the latencies and
+        throttling responses that the calls see.
+        """
+
+        if compression not in _compressors:
+            raise ValueError(f"unsupported compression {compression!r}")
+
+        self.base_url = url
+        self.auth_code = auth_code
+        self.pool_config = pool_config
+        self.retry_policy = retry_policy
+        self.timeout = timeout
+        self.compression = compression
+        self.limiter = limiter
+
+        # The adapter owns the connection pools and is thread-safe, so it is
+        # shared by every thread. Sessions carry mutable state (cookies,
+        # headers), so each thread gets its own session mounted on the
+        # shared adapter.
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_config.num_pools,
+            pool_maxsize=pool_config.max_connections_per_host,
+            pool_block=pool_config.block)
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        session: Optional[requests.Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            if not self.pool_config.keep_alive:
+                session.headers["Connection"] = "close"
+            self._local.session = session
+        return session
+
+    def close(self) -> None:
+        self._adapter.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def create_user(self, name: str, description: str) -> User:
+        params = {
+            "auth_code": self.auth_code,
+            "name": name,
+            "description": description,
+        }
+        url = f"{self.base_url}/user"
+        resp = self._post(url, idempotent=False, params=params)
+
+        json = resp.json()
+        return User(json["user_id"], json["description"])
+
+    def create_complete_game(self, args: CreateCompleteGameArgs) -> Game:
+        url = f"{self.base_url}/completegame"
+        headers = {"Idempotency-Key": _idempotency_key(args)}
+        resp = self._post_json(url, _complete_game_args_to_dict(args), headers)
+
+        return _game_from_json(resp.json())
+
+    def create_complete_games(
+        self,
+        args_list: List[CreateCompleteGameArgs],
+        chunk_size: int = 100) -> BatchUploadResult:
+        """
+        Uploads many games, chunk_size games per request. A game the server
+        rejects, or every game in a chunk whose request failed, is reported
+        in failures and leaves a None in games; the other chunks are still
+        uploaded.
+        """
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        url = f"{self.base_url}/completegames"
+        games: List[Optional[Game]] = []
+        failures: List[BatchUploadFailure] = []
+
+        for chunk_start in range(0, len(args_list), chunk_size):
+            chunk = args_list[chunk_start:chunk_start + chunk_size]
+            games_json = [
+                dict(_complete_game_args_to_dict(args), idempotency_key=_idempotency_key(args))
+                for args in chunk
+            ]
+            try:
+                resp = self._post_json(url, {"games": games_json}, {})
+                chunk_games = _batch_games_from_json(resp.json(), len(chunk))
+            except (requests.RequestException, ValueError) as e:
+                chunk_games = [str(e)] * len(chunk)
+
+            for i, (args, game) in enumerate(zip(chunk, chunk_games)):
+                if isinstance(game, Game):
+                    games.append(game)
+                else:
+                    games.append(None)
+                    failures.append(BatchUploadFailure(chunk_start + i, args, game))
+
+        return BatchUploadResult(games, failures)
+
+    def _post_json(self, url: str, body: Dict, headers: Dict[str, str]) -> requests.Response:
+        """
+        POSTs an idempotent JSON request, compressed if the client was
+        created with a compression. If the server answers a compressed body
+        with 415 Unsupported Media Type, the body is sent again uncompressed
+        and compression is turned off for the rest of the client's life.
+        """
+
+        data = _encode_json(body)
+        headers = dict(headers, **{"Content-Type": "application/json"})
+
+        compression = self.compression
+        if compression:
+            compressed_headers = dict(headers, **{"Content-Encoding": compression})
+            try:
+                return self._post(
+                    url, idempotent=True, data=_compress(data, compression), headers=compressed_headers)
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code != 415:
+                    raise
+                self.compression = None
+
+        return self._post(url, idempotent=True, data=data, headers=headers)
+
+    def _post(self, url: str, idempotent: bool, **kwargs) -> requests.Response:
+        """
+        POSTs with retries. Idempotent requests are retried after timeouts,
+        connection errors and any of the policy's retry statuses. Other
+        requests are only retried when the server cannot have acted on them:
+        a 429 response or a connect timeout.
+        """
+
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            last_attempt = attempt >= policy.max_attempts - 1
+            try:
+                resp = self._send(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                retryable = idempotent or isinstance(e, requests.ConnectTimeout)
+                if last_attempt or not retryable:
+                    raise
+                time.sleep(policy.backoff(attempt))
+                attempt += 1
+                continue
+
+            retryable = \
+                resp.status_code in policy.retry_statuses \
+                and (idempotent or resp.status_code == 429)
+            if last_attempt or not retryable:
+                resp.raise_for_status()
+                return resp
+
+            time.sleep(max(policy.backoff(attempt), _retry_after(resp)))
+            attempt += 1
+
+    def _send(self, url: str, **kwargs) -> requests.Response:
+        limiter = self.limiter
+        if limiter is None:
+            return self.session.post(url, timeout=self.timeout, **kwargs)
+
+        limiter.acquire()
+        start = time.monotonic()
+        # Anything that escapes, such as a timeout, counts as overload.
+        overloaded = True
+        try:
+            resp = self.session.post(url, timeout=self.timeout, **kwargs)
+            overloaded = resp.status_code in (429, 503)
+            return resp
+        finally:
+            limiter.release(time.monotonic() - start, overloaded)
+
+
+
+def _retry_after(resp: requests.Response) -> float:
+    try:
+        return float(resp.headers.get("Retry-After", 0))
+    except ValueError:
+        # Retry-After may also be an HTTP date; fall back to the backoff.
+        return 0.0
@@ -0,0 +1,153 @@
+import json
+import pytest
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from . import (
+    Client, CompleteGamesGuess, CreateCompleteGameArgs, PoolConfig, RetryPolicy,
+    _complete_game_args_to_dict, _encode_json)
+from .stand_in_server import StandInServer
+
+
+def _game_args(user_id: int, seed: int) -> CreateCompleteGameArgs:
+    guesses = [CompleteGamesGuess("cigar", "ggggg", 0)]
+    return CreateCompleteGameArgs("token", user_id, seed, "cigar", 1, guesses)
+
+
+def test_complete_game_args_encoding():
+    guesses = [CompleteGamesGuess("bread", "wywgw", 12), CompleteGamesGuess("cigar", "ggggg", 0)]
+    args = CreateCompleteGameArgs("token", 3, 7, "cigar", 1, guesses)
+
+    assert _complete_game_args_to_dict(args) == asdict(args)
+    assert json.loads(_encode_json(_complete_game_args_to_dict(args))) == asdict(args)
+
+
+def test_client_reuses_connection():
+    with StandInServer() as server, Client("token", server.url) as client:
+        user = client.create_user("name", "description")
+        for seed in range(5):
+            game = client.create_complete_game(_game_args(user.user_id, seed))
+            assert game.seed == seed
+
+        assert server.num_requests == 6
+        assert server.num_connections == 1
+
+
+def test_client_shared_across_threads():
+    pool_config = PoolConfig(max_connections_per_host=2, block=True)
+    with StandInServer() as server, Client("token", server.url, pool_config) as client:
+        user = client.create_user("name", "description")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            games = list(executor.map(
+                lambda seed: client.create_complete_game(_game_args(user.user_id, seed)),
+                range(20)))
+
+        assert [g.seed for g in games] == list(range(20))
+        assert len(server.games) == 20
+        assert server.num_connections <= 2
+
+
+def test_client_retries_uploads():
+    retry_policy = RetryPolicy(max_attempts=3, backoff_base=0.001)
+    with StandInServer() as server, Client("token", server.url, retry_policy=retry_policy) as client:
+        user = client.create_user("name", "description")
+
+        server.state.scripted_failures = [503, 500]
+        game = client.create_complete_game(_game_args(user.user_id, 0))
+        assert server.num_requests == 4
+
+        # Uploading the same game again does not create a duplicate.
+        assert client.create_complete_game(_game_args(user.user_id, 0)) == game
+        assert len(server.games) == 1
+
+        server.state.scripted_failures = [503, 503, 503]
+        with pytest.raises(requests.HTTPError):
+            client.create_complete_game(_game_args(user.user_id, 1))
+
+
+def test_client_retries_create_user_only_when_throttled():
+    retry_policy = RetryPolicy(max_attempts=3, backoff_base=0.001)
+    with StandInServer() as server, Client("token", server.url, retry_policy=retry_policy) as client:
+        server.state.scripted_failures = [429]
+        client.create_user("name", "description")
+        assert server.num_requests == 2
+
+        server.state.scripted_failures = [503]
+        with pytest.raises(requests.HTTPError):
+            client.create_user("name", "description")
+        assert len(server.state.users) == 1
+
+
+def test_client_without_keep_alive():
+    pool_config = PoolConfig(keep_alive=False)
+    with StandInServer() as server, Client("token", server.url, pool_config) as client:
+        client.create_user("name", "description")
+        client.create_user("name", "description")
+
+        assert server.num_connections == 2
+
+
+def test_create_complete_games():
+    with StandInServer() as server, Client("token", server.url) as client:
+        user = client.create_user("name", "description")
+        args_list = [_game_args(user.user_id, seed) for seed in range(25)]
+        # Unknown user, rejected by the server.
+        args_list[7] = _game_args(1234, 7)
+
+        result = client.create_complete_games(args_list, chunk_size=10)
+
+        assert server.num_requests == 4
+        assert len(result.games) == 25
+        assert result.games[7] is None
+        assert [g.seed for g in result.games if g] == [s for s in range(25) if s != 7]
+        assert [(f.index, f.args.seed) for f in result.failures] == [(7, 7)]
+
+
+@pytest.mark.parametrize("compression", ["gzip", "deflate"])
+def test_client_compresses_uploads(compression):
+    guesses = [CompleteGamesGuess("cigar", "wwwww", 10)] * 20
+
+    sizes = []
+    for client_compression in [None, compression]:
+        with StandInServer() as server, Client("token", server.url, compression=client_compression) as client:
+            user = client.create_user("name", "description")
+            args = CreateCompleteGameArgs("token", user.user_id, 0, "rebut", 2, guesses)
+            game = client.create_complete_game(args)
+            result = client.create_complete_games([args])
+
+            assert game.num_guesses == 20
+            assert result.games == [game]
+            sizes.append(server.state.num_body_bytes)
+
+    assert sizes[1] < sizes[0] / 4
+
+
+def test_client_falls_back_to_uncompressed_uploads():
+    with StandInServer(accept_compression=False) as server, Client("token", server.url, compression="gzip") as client:
+        user = client.create_user("name", "description")
+        client.create_complete_game(_game_args(user.user_id, 0))
+        client.create_complete_game(_game_args(user.user_id, 1))
+
+        assert client.compression is None
+        assert len(server.games) == 2
+        assert server.num_requests == 4
+
+
+def test_create_complete_games_malformed_response(monkeypatch):
+    with StandInServer() as server, Client("token", server.url) as client:
+        user = client.create_user("name", "description")
+        args_list = [_game_args(user.user_id, seed) for seed in range(3)]
+
+        # The server drops the last result of every chunk.
+        post_json = client._post_json
+        def short_post_json(url, body, headers):
+            resp = post_json(url, body, headers)
+            results = resp.json()["results"][:-1]
+            monkeypatch.setattr(resp, "json", lambda: {"results": results})
+            return resp
+        monkeypatch.setattr(client, "_post_json", short_post_json)
+
+        result = client.create_complete_games(args_list, chunk_size=2)
+
+        assert result.games == [None, None, None]
+        assert [f.index for f in result.failures] == [0, 1, 2]
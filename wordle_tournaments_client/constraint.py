@@ -0,0 +1,68 @@
+import functools
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple
+from .patterns import decode_score
+
+
+@dataclass(frozen=True)
+class Constraint:
+    """
+    What a scored guess says about the solution, worked out once so that
+    checking a word doesn't re-derive it.
+
+    A green pins its letter to its position and a yellow rules its letter
+    out of its position. The greens and yellows of a letter give the least
+    number of that letter in the solution, and a gray of the same letter
+    makes that the most as well. This is exactly the test of
+    solvers.is_eligible.
+    """
+
+    # (position, letter) pairs the word must have.
+    fixed: Tuple[Tuple[int, str], ...]
+    # (position, letter) pairs the word must not have.
+    forbidden: Tuple[Tuple[int, str], ...]
+    # (letter, n) pairs: the word has at least n of letter.
+    min_counts: Tuple[Tuple[str, int], ...]
+    # (letter, n) pairs: the word has at most n of letter.
+    max_counts: Tuple[Tuple[str, int], ...]
+
+    @classmethod
+    def from_score(cls, guess: str, score: str) -> "Constraint":
+        marks = list(zip(guess, score))
+        present = Counter(letter for letter, mark in marks if mark in "gy")
+        absent = sorted({letter for letter, mark in marks if mark == "w"})
+        return cls(
+            fixed=tuple((i, letter) for i, (letter, mark) in enumerate(marks) if mark == "g"),
+            forbidden=tuple((i, letter) for i, (letter, mark) in enumerate(marks) if mark == "y"),
+            min_counts=tuple(sorted(present.items())),
+            max_counts=tuple((letter, present[letter]) for letter in absent))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def from_code(guess: str, code: int) -> "Constraint":
+        """
+        from_score() for a pattern code. Cached, since solvers see the same
+        guess and score in many games.
+        """
+
+        return Constraint.from_score(guess, decode_score(code))
+
+    def matches(self, word: str) -> bool:
+        for i, letter in self.fixed:
+            if word[i] != letter:
+                return False
+        for i, letter in self.forbidden:
+            if word[i] == letter:
+                return False
+        for letter, n in self.min_counts:
+            if word.count(letter) < n:
+                return False
+        for letter, n in self.max_counts:
+            if word.count(letter) > n:
+                return False
+        return True
+
+    def filter(self, words: Iterable[str]) -> List[str]:
+        matches = self.matches
+        return [word for word in words if matches(word)]
@@ -0,0 +1,21 @@
+from .constraint import Constraint
+
+
+def test_constraint_from_score():
+    constraint = Constraint.from_score("geese", "gywwg")
+
+    assert constraint.fixed == ((0, "g"), (4, "e"))
+    assert constraint.forbidden == ((1, "e"),)
+    assert constraint.min_counts == (("e", 2), ("g", 1))
+    assert constraint.max_counts == (("e", 2), ("s", 0))
+
+
+def test_constraint_matches():
+    constraint = Constraint.from_score("geese", "gywwg")
+
+    assert constraint.matches("glebe")
+    assert not constraint.matches("gleee")
+    assert not constraint.matches("geode")
+    assert constraint.matches("grebe")
+    assert constraint.filter(["glebe", "gorse", "grebe"]) == ["glebe", "grebe"]
+    assert Constraint.from_score("", "").matches("cigar")
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+from typing import List
+
+
+def _modules_after(code: str) -> List[str]:
+    check = f"{code}\nimport sys\nprint(' '.join(sorted(sys.modules)))"
+    return subprocess.run(
+        [sys.executable, "-c", check], check=True, capture_output=True, text=True).stdout.split()
+
+
+def test_import_is_lazy():
+    modules = _modules_after("import wordle_tournaments_client")
+    assert "requests" not in modules
+    assert "wordle_tournaments_client.wordle_valid_words" not in modules
+    assert "wordle_tournaments_client.scrabble_words" not in modules
+
+
+def test_client_does_not_load_word_lists():
+    modules = _modules_after("from wordle_tournaments_client import Client")
+    assert "requests" in modules
+    assert "wordle_tournaments_client.wordle_valid_words" not in modules
+
+
+def test_word_lists_load_on_access():
+    import wordle_tournaments_client
+    words = wordle_tournaments_client.wordle_solution_words
+    assert isinstance(words, list)
+    assert words[0] == "cigar"
+    assert wordle_tournaments_client.wordle_solution_words is words
+
+
+def test_import_does_not_load_numpy():
+    modules = _modules_after("import wordle_tournaments_client")
+    assert "numpy" not in modules
+
+
+def test_packed_word_lists_do_not_shadow_word_lists():
+    check = (
+        "import wordle_tournaments_client as w\n"
+        "w.wordle_solution_words_packed\n"
+        "print(type(w.wordle_solution_words).__name__, w.wordle_solution_words[0])")
+    output = subprocess.run(
+        [sys.executable, "-c", check], check=True, capture_output=True, text=True).stdout
+    assert output.split() == ["list", "cigar"]
@@ -0,0 +1,59 @@
+from typing import List, Tuple
+from .candidates import CandidateSet
+from .constraint import Constraint
+from .word_table import WordTable, word_length
+
+num_letters = 26
+
+
+class LetterIndex:
+    """
+    Inverted index of a WordTable, for filtering candidates by a guess and
+    its score with set operations instead of checking each word.
+
+    at[position][letter] is the set of words with that letter at that
+    position, and min_count[letter][n] the set of words with at least n of
+    that letter, for n in 0..6 (n = 6 is always empty). Letters are the
+    codes of WordTable.letters.
+    """
+
+    table: WordTable
+    at: Tuple[Tuple[CandidateSet, ...], ...]
+    min_count: Tuple[Tuple[CandidateSet, ...], ...]
+
+    def __init__(self, table: WordTable) -> None:
+        self.table = table
+        letters = table.letters
+        self.at = tuple(
+            tuple(CandidateSet.from_flags(table, letters[:, position] == letter) for letter in range(num_letters))
+            for position in range(word_length))
+
+        min_count: List[Tuple[CandidateSet, ...]] = []
+        for letter in range(num_letters):
+            counts = (letters == letter).sum(axis=1)
+            min_count.append(tuple(
+                CandidateSet.from_flags(table, counts >= n) for n in range(word_length + 2)))
+        self.min_count = tuple(min_count)
+
+    def matching(self, constraint: Constraint) -> CandidateSet:
+        """
+        The words of the table that satisfy constraint.
+        """
+
+        result = CandidateSet(self.table, (1 << len(self.table)) - 1)
+        for position, letter in constraint.fixed:
+            result &= self.at[position][_code(letter)]
+        for position, letter in constraint.forbidden:
+            result -= self.at[position][_code(letter)]
+        for letter, n in constraint.min_counts:
+            result &= self.min_count[_code(letter)][n]
+        for letter, n in constraint.max_counts:
+            result -= self.min_count[_code(letter)][n + 1]
+        return result
+
+    def filter(self, candidates: CandidateSet, constraint: Constraint) -> CandidateSet:
+        return candidates & self.matching(constraint)
+
+
+def _code(letter: str) -> int:
+    return ord(letter) - ord("a")
@@ -0,0 +1,30 @@
+from .candidates import CandidateSet
+from .constraint import Constraint
+from .letter_index import LetterIndex
+from .word_table import WordTable
+
+
+def test_letter_index():
+    table = WordTable(["cigar", "rebut", "sissy", "civic", "eerie"], [], [])
+    index = LetterIndex(table)
+
+    assert index.at[0][ord("c") - ord("a")].words() == ["cigar", "civic"]
+    assert index.min_count[ord("s") - ord("a")][3].words() == ["sissy"]
+    assert index.min_count[ord("e") - ord("a")][2].words() == ["eerie"]
+    assert not index.min_count[0][6]
+
+    assert index.matching(Constraint.from_score("cxxxx", "gwwww")).words() == ["cigar", "civic"]
+    assert index.matching(Constraint.from_score("xixxx", "wgwww")).words() == ["cigar", "sissy", "civic"]
+    assert index.matching(Constraint.from_score("ixxxx", "ywwww")).words() == ["cigar", "sissy", "civic", "eerie"]
+    # One c in the solution, and no more.
+    assert index.matching(Constraint.from_score("ccxxx", "gwwww")).words() == ["cigar"]
+    assert index.matching(Constraint.from_score("eeeee", "ggwww")).words() == []
+    assert index.matching(Constraint.from_score("xxxxx", "")).words() == list(table.words)
+
+
+def test_letter_index_filter():
+    table = WordTable(["cigar", "rebut", "sissy"], [], [])
+    index = LetterIndex(table)
+    candidates = CandidateSet.from_words(table, ["rebut", "sissy"])
+
+    assert index.filter(candidates, Constraint.from_score("rxxxx", "wwwww")).words() == ["sissy"]
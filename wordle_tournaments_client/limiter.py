@@ -0,0 +1,101 @@
+import threading
+import time
+from typing import Callable
+
+
+class AdaptiveLimiter:
+    """
+    Client-side AIMD (additive increase, multiplicative decrease) control of
+    request concurrency and rate.
+
+    Every request calls acquire() before it is sent and release() once it
+    has finished. A request that finishes within target_latency raises the
+    concurrency limit by roughly one per round of limit requests, and the
+    rate limit by roughly one request per second each second. A request that
+    is throttled (429), rejected as overloaded (503), times out or takes
+    longer than target_latency multiplies both limits by decrease_factor,
+    at most once per target_latency so that one burst of failures counts as
+    a single overload. Neither limit goes above its ceiling.
+    """
+
+    max_concurrency: int
+    min_concurrency: int
+    max_rate: float
+    min_rate: float
+    target_latency: float
+    decrease_factor: float
+    concurrency_limit: float
+    rate_limit: float
+    in_flight: int
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        initial_concurrency: int = 2,
+        max_rate: float = 100.0,
+        initial_rate: float = 10.0,
+        target_latency: float = 1.0,
+        decrease_factor: float = 0.5,
+        min_concurrency: int = 1,
+        min_rate: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep) -> None:
+
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.target_latency = target_latency
+        self.decrease_factor = decrease_factor
+        self.concurrency_limit = float(min(initial_concurrency, max_concurrency))
+        self.rate_limit = min(initial_rate, max_rate)
+        self.in_flight = 0
+
+        self._clock = clock
+        self._sleep = sleep
+        self._cond = threading.Condition()
+        self._next_start = clock()
+        self._last_decrease = float("-inf")
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request may be sent under both limits.
+        """
+
+        with self._cond:
+            while self.in_flight >= int(self.concurrency_limit):
+                self._cond.wait()
+
+            # Reserve the next start slot under the rate limit, then wait for
+            # it outside the lock so other callers can reserve later slots.
+            self.in_flight += 1
+            now = self._clock()
+            start = max(self._next_start, now)
+            self._next_start = start + 1 / self.rate_limit
+
+        if start > now:
+            self._sleep(start - now)
+
+    def release(self, latency: float, overloaded: bool) -> None:
+        """
+        Records the outcome of a request started with acquire(). overloaded
+        is true if the server throttled or failed the request because of
+        load, or if it timed out.
+        """
+
+        with self._cond:
+            self.in_flight -= 1
+
+            if overloaded or latency > self.target_latency:
+                now = self._clock()
+                if now - self._last_decrease >= self.target_latency:
+                    self._last_decrease = now
+                    self.concurrency_limit = max(
+                        float(self.min_concurrency), self.concurrency_limit * self.decrease_factor)
+                    self.rate_limit = max(self.min_rate, self.rate_limit * self.decrease_factor)
+            else:
+                self.concurrency_limit = min(
+                    float(self.max_concurrency), self.concurrency_limit + 1 / self.concurrency_limit)
+                self.rate_limit = min(self.max_rate, self.rate_limit + 1 / self.rate_limit)
+
+            self._cond.notify_all()
@@ -0,0 +1,99 @@
+from concurrent.futures import ThreadPoolExecutor
+from . import Client, RetryPolicy, TournamentRunner
+from .client_test import _game_args
+from .limiter import AdaptiveLimiter
+from .stand_in_server import StandInServer
+from .tournament_test import FixedGuessSolver
+
+
+class FakeClock:
+    now: float
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_limiter_aimd():
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(
+        max_concurrency=4, initial_concurrency=2, max_rate=20.0, initial_rate=10.0,
+        target_latency=1.0, clock=clock, sleep=clock.sleep)
+
+    for _ in range(20):
+        limiter.acquire()
+        clock.now += 1
+        limiter.release(0.1, overloaded=False)
+    assert limiter.concurrency_limit == 4
+    assert 10.0 < limiter.rate_limit <= 20.0
+    rate_limit = limiter.rate_limit
+
+    limiter.acquire()
+    limiter.release(0.1, overloaded=True)
+    assert limiter.concurrency_limit == 2
+    assert limiter.rate_limit == rate_limit / 2
+
+    # A second overload within target_latency is part of the same event.
+    limiter.acquire()
+    limiter.release(2.0, overloaded=False)
+    assert limiter.concurrency_limit == 2
+
+    clock.now += 1
+    limiter.acquire()
+    limiter.release(2.0, overloaded=False)
+    assert limiter.concurrency_limit == 1
+    assert limiter.in_flight == 0
+
+
+def test_limiter_paces_requests():
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(initial_concurrency=4, initial_rate=10.0, clock=clock, sleep=clock.sleep)
+
+    for _ in range(3):
+        limiter.acquire()
+
+    # The first request starts at once, the next two wait for their slots.
+    assert abs(clock.now - 0.2) < 1e-9
+    assert limiter.in_flight == 3
+
+
+def test_limiter_backs_off_throttling_server():
+    # target_latency is far above any request's latency, so that only the
+    # 429s reduce the limits, however slow the machine running the test.
+    limiter = AdaptiveLimiter(initial_concurrency=8, initial_rate=400.0, max_rate=400.0, target_latency=10.0)
+    retry_policy = RetryPolicy(max_attempts=20, backoff_base=0.01, backoff_max=0.05)
+    with StandInServer() as server, \
+            Client("token", server.url, retry_policy=retry_policy, limiter=limiter) as client:
+        user = client.create_user("name", "description")
+        server.state.scripted_failures = [429] * 5
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            games = list(executor.map(
+                lambda seed: client.create_complete_game(_game_args(user.user_id, seed)),
+                range(60)))
+
+        assert [g.seed for g in games] == list(range(60))
+        assert server.num_requests == 66
+        assert limiter.rate_limit < 400.0
+        assert limiter.in_flight == 0
+
+
+def test_tournament_runners_share_limiter():
+    limiter = AdaptiveLimiter(initial_concurrency=4, initial_rate=200.0, max_rate=200.0)
+    with StandInServer() as server:
+        runners = [
+            TournamentRunner(
+                FixedGuessSolver(["cigar"]), "token", f"runner {i}", "description",
+                seed_start=0, seed_end=9, max_num_turns=3,
+                client=Client("token", server.url, limiter=limiter))
+            for i in range(2)
+        ]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(lambda runner: runner.play_tournament(), runners))
+
+        assert len(server.games) == 20
+        assert limiter.in_flight == 0
@@ -0,0 +1,68 @@
+"""
+Scores as base-3 integer pattern codes.
+
+The code of a score has one base-3 digit per position, the first position
+being the most significant, with w = 0, y = 1 and g = 2. "wwwww" is 0 and
+"ggggg" is 242, so every code fits in a uint8. Codes are cheaper to build,
+compare and use as indexes than score strings, which are only needed when
+talking to the server.
+"""
+
+from typing import Dict, Tuple
+
+word_length = 5
+num_patterns = 3 ** word_length
+all_green = num_patterns - 1
+
+_marks = "wyg"
+
+# The score string of each code.
+pattern_strings: Tuple[str, ...] = tuple(
+    "".join(_marks[code // 3 ** (word_length - 1 - i) % 3] for i in range(word_length))
+    for code in range(num_patterns))
+
+_codes: Dict[str, int] = {score: code for code, score in enumerate(pattern_strings)}
+
+
+def encode_score(score: str) -> int:
+    """
+    Raises ValueError if score isn't 5 of "g", "y" and "w".
+    """
+
+    try:
+        return _codes[score]
+    except KeyError:
+        raise ValueError(f"invalid score {score!r}") from None
+
+
+def decode_score(code: int) -> str:
+    """
+    Raises ValueError if code isn't in 0..242.
+    """
+
+    if not 0 <= code < num_patterns:
+        raise ValueError(f"invalid pattern code {code}")
+    return pattern_strings[code]
+
+
+def score_code(guess: str, solution: str) -> int:
+    """
+    The pattern code of _score_guess(guess, solution), computed without
+    building the string.
+    """
+
+    if guess == solution:
+        return all_green
+
+    # Solution letters not matched by a green, which yellows use up left to
+    # right.
+    unmatched = [s for g, s in zip(guess, solution) if g != s]
+    code = 0
+    for g, s in zip(guess, solution):
+        code *= 3
+        if g == s:
+            code += 2
+        elif g in unmatched:
+            unmatched.remove(g)
+            code += 1
+    return code
@@ -0,0 +1,73 @@
+import itertools
+import random
+import pytest
+from collections import Counter
+from . import GameResult, MemoryGameRunner, Solver, _score_guess
+from .patterns import all_green, decode_score, encode_score, num_patterns, pattern_strings, score_code
+
+
+def _reference_score(guess: str, solution: str) -> str:
+    # The Counter-based scoring that score_code replaced.
+    sol_char_counts = Counter(solution)
+    score = ["w"] * 5
+    for i, guess_c in enumerate(guess):
+        if solution[i] == guess_c:
+            sol_char_counts.subtract(guess_c)
+            score[i] = "g"
+    for i, guess_c in enumerate(guess):
+        if solution[i] != guess_c and sol_char_counts[guess_c] > 0:
+            score[i] = "y"
+            sol_char_counts.subtract(guess_c)
+    return "".join(score)
+
+
+def test_pattern_strings():
+    assert len(pattern_strings) == num_patterns == 243
+    assert pattern_strings[0] == "wwwww"
+    assert pattern_strings[all_green] == "ggggg"
+    assert pattern_strings[1] == "wwwwy"
+    assert pattern_strings[2 * 81] == "gwwww"
+
+
+def test_encode_decode_score():
+    for score in map("".join, itertools.product("wyg", repeat=5)):
+        assert decode_score(encode_score(score)) == score
+    with pytest.raises(ValueError):
+        encode_score("ggggx")
+    with pytest.raises(ValueError):
+        encode_score("")
+    with pytest.raises(ValueError):
+        decode_score(243)
+
+
+def test_score_code_matches_reference():
+    words = ["cigar", "sissy", "eerie", "geese", "lever", "abbey", "babes", "kebab", "speed", "eager"]
+    pairs = list(itertools.product(words, repeat=2))
+    rng = random.Random(0)
+    pairs += [("".join(rng.choices("abcde", k=5)), "".join(rng.choices("abcde", k=5))) for _ in range(2000)]
+
+    for guess, solution in pairs:
+        assert decode_score(score_code(guess, solution)) == _reference_score(guess, solution)
+        assert _score_guess(guess, solution) == _reference_score(guess, solution)
+
+
+class _StringSolver(Solver):
+    def __init__(self):
+        self.scores = []
+
+    def get_guess(self, last_guess, last_guess_valid, last_guess_score):
+        self.scores.append(last_guess_score)
+        return ["bread", "cigar"][len(self.scores) - 1], 0
+
+    def reset(self):
+        pass
+
+
+def test_string_solvers_get_score_strings():
+    solver = _StringSolver()
+    result = MemoryGameRunner("cigar", solver, 10).play_game()
+
+    assert solver.scores == ["", _score_guess("bread", "cigar")]
+    assert result == GameResult(
+        True, 2, [("bread", "wywgw"), ("cigar", "ggggg")],
+        [encode_score("wywgw"), all_green])
@@ -0,0 +1,533 @@
+"""
+The score of every guess against every solution, computed with numpy and
+stored as uint8 pattern codes (see patterns).
+
+Built matrices are cached as .npy files, by default in
+~/.cache/wordle_tournaments_client, or $WORDLE_TOURNAMENTS_CACHE_DIR if set,
+and memory-mapped read-only by later processes.
+"""
+
+import functools
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Optional, Sequence, Tuple, Union
+import numpy as np
+from .candidates import CandidateSet
+from .constraint import Constraint
+from .patterns import pattern_strings
+from .word_table import WordTable, encode_letters, word_length
+
+# Part of every cache file name and key. Bump it whenever score_codes() or
+# the file layout changes, so that stale cache files are never read.
+cache_version = 1
+
+# Guesses scored per step of score_codes(), which bounds its temporary
+# arrays to a few MB each.
+_block_size = 1024
+
+# The marks of each pattern code, 0 for w, 1 for y and 2 for g.
+_pattern_marks = np.array([["wyg".index(mark) for mark in score] for score in pattern_strings], dtype=np.uint8)
+
+# Upper bound on the bytes of temporary arrays score_codes() needs per
+# guess×solution pair: the green masks, counts, yellows and codes.
+_temp_bytes_per_pair = 16
+
+
+def score_codes(
+    guess_letters: np.ndarray,
+    solution_letters: np.ndarray,
+    block_size: Optional[int] = None) -> np.ndarray:
+    """
+    Returns the G×S uint8 array of the pattern codes of each of G guesses
+    against each of S solutions, given as letter-code arrays such as
+    WordTable.letters. Matches _score_guess for every pair. Guesses are
+    scored block_size at a time.
+    """
+
+    block_size = block_size or _block_size
+    codes = np.empty((len(guess_letters), len(solution_letters)), dtype=np.uint8)
+    # letter_counts[c, s] is the number of letter c in solution s.
+    letter_counts = np.zeros((26, len(solution_letters)), dtype=np.int8)
+    for k in range(word_length):
+        np.add.at(letter_counts, (solution_letters[:, k], np.arange(len(solution_letters))), 1)
+
+    for start in range(0, len(guess_letters), block_size):
+        guesses = guess_letters[start:start + block_size]
+        green = [guesses[:, k, None] == solution_letters[None, :, k] for k in range(word_length)]
+        block = np.zeros((len(guesses), len(solution_letters)), dtype=np.uint8)
+
+        for i in range(word_length):
+            # Whether position k of each guess has the same letter as i.
+            same = [(guesses[:, k] == guesses[:, i])[:, None] for k in range(word_length)]
+            # Copies of the letter in the solution that no green took, and
+            # copies of it earlier in the guess that weren't green. Yellows
+            # go to the non-green copies left to right, as in _score_guess.
+            unmatched = letter_counts[guesses[:, i]]
+            earlier = np.zeros(block.shape, dtype=np.int8)
+            for k in range(word_length):
+                unmatched = unmatched - (green[k] & same[k])
+                if k < i:
+                    earlier += same[k] & ~green[k]
+            yellow = ~green[i] & (earlier < unmatched)
+            block = block * 3 + green[i].astype(np.uint8) * 2 + yellow
+
+        codes[start:start + block_size] = block
+    return codes
+
+
+def build_score_file(
+    path: str,
+    guess_letters: np.ndarray,
+    solution_letters: np.ndarray,
+    max_memory: int = 64 * 1024 * 1024,
+    num_workers: int = 0) -> np.ndarray:
+    """
+    Writes score_codes(guess_letters, solution_letters) to a .npy file at
+    path and returns it memory-mapped read-only.
+
+    The rows are scored in blocks small enough for their temporary arrays
+    to fit in max_memory bytes, and each block is written straight into
+    the mapped file, so memory use stays flat however big the matrix is.
+    With num_workers > 0, a pool of that many processes scores the
+    blocks, each writing its rows into the same file. The file is written
+    under a temporary name and renamed into place once complete.
+    """
+
+    shape = (len(guess_letters), len(solution_letters))
+    rows_per_block = max(1, max_memory // max(1, shape[1] * _temp_bytes_per_pair))
+    starts = range(0, shape[0], rows_per_block)
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        codes = np.lib.format.open_memmap(temp_path, mode="w+", dtype=np.uint8, shape=shape)
+        if num_workers > 0:
+            codes.flush()
+            with ProcessPoolExecutor(num_workers) as executor:
+                list(executor.map(
+                    _build_block,
+                    repeat(temp_path),
+                    starts,
+                    (guess_letters[start:start + rows_per_block] for start in starts),
+                    repeat(solution_letters)))
+        else:
+            for start in starts:
+                block = guess_letters[start:start + rows_per_block]
+                codes[start:start + len(block)] = score_codes(block, solution_letters, len(block))
+        codes.flush()
+        del codes
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return np.load(path, mmap_mode="r", allow_pickle=False)
+
+
+def _build_block(path: str, start: int, guess_letters: np.ndarray, solution_letters: np.ndarray) -> None:
+    # Runs in a build_score_file() worker process.
+    codes = np.load(path, mmap_mode="r+", allow_pickle=False)
+    codes[start:start + len(guess_letters)] = score_codes(guess_letters, solution_letters, len(guess_letters))
+    codes.flush()
+
+
+def score_pairs(
+    guesses: Union[Sequence[str], np.ndarray],
+    solutions: Union[Sequence[str], np.ndarray]) -> np.ndarray:
+    """
+    Returns the uint8 pattern code of guesses[i] against solutions[i] for
+    each i. Either argument may be words or a letter-code array, and the two
+    are broadcast against each other, so one guess can be scored against
+    many solutions or the other way round.
+    """
+
+    guess_letters = _as_letters(guesses)
+    solution_letters = _as_letters(solutions)
+    green = guess_letters == solution_letters
+    codes = np.zeros(np.broadcast_shapes(guess_letters.shape, solution_letters.shape)[:-1], dtype=np.uint8)
+
+    for i in range(word_length):
+        letter = guess_letters[..., i:i + 1]
+        # As in score_codes(): copies of the letter in the solution that no
+        # green took, against non-green copies earlier in the guess.
+        unmatched = ((solution_letters == letter) & ~green).sum(axis=-1)
+        earlier = ((guess_letters[..., :i] == letter) & ~green[..., :i]).sum(axis=-1)
+        yellow = ~green[..., i] & (earlier < unmatched)
+        codes = codes * 3 + green[..., i].astype(np.uint8) * 2 + yellow
+    return codes
+
+
+def score_many(guess: str, solutions: Union[Sequence[str], np.ndarray]) -> np.ndarray:
+    """
+    The uint8 pattern codes of guess against each of solutions.
+    """
+
+    if len(guess) != word_length:
+        raise ValueError(f"{guess!r} is not {word_length} letters long")
+    solution_letters = _as_letters(solutions)
+    codes = np.zeros(len(solution_letters), dtype=np.uint8)
+    guess_letters = [ord(c) - ord("a") for c in guess]
+    # Columns of the solutions, and where each has the guess's letter.
+    columns = [solution_letters[:, k] for k in range(word_length)]
+    green = [columns[k] == guess_letters[k] for k in range(word_length)]
+
+    for i, letter in enumerate(guess_letters):
+        # As in score_codes(), but the guess is known, so its repeated
+        # letters are found in Python rather than compared per solution.
+        unmatched = np.zeros(len(codes), dtype=np.int8)
+        for k in range(word_length):
+            unmatched += (columns[k] == letter) & ~green[k]
+        earlier = np.zeros(len(codes), dtype=np.int8)
+        for j in range(i):
+            if guess_letters[j] == letter:
+                earlier += ~green[j]
+        yellow = ~green[i] & (earlier < unmatched)
+        codes = codes * 3 + green[i].astype(np.uint8) * 2 + yellow
+    return codes
+
+
+def _as_letters(words: Union[Sequence[str], np.ndarray]) -> np.ndarray:
+    if isinstance(words, np.ndarray):
+        return words
+    return encode_letters(words)
+
+
+class ScoreMatrix:
+    """
+    Pattern codes of guesses against solutions, both given as word IDs of a
+    WordTable. Row r holds the codes of guess_ids[r] against every
+    solution, in the order of solution_ids.
+    """
+
+    table: WordTable
+    guess_ids: np.ndarray
+    solution_ids: np.ndarray
+    codes: np.ndarray
+
+    def __init__(
+        self,
+        table: WordTable,
+        guess_ids: np.ndarray,
+        solution_ids: np.ndarray,
+        codes: np.ndarray) -> None:
+
+        if codes.shape != (len(guess_ids), len(solution_ids)):
+            raise ValueError(f"codes has shape {codes.shape}, expected {(len(guess_ids), len(solution_ids))}")
+        self.table = table
+        self.guess_ids = guess_ids
+        self.solution_ids = solution_ids
+        self.codes = codes
+        # Word ID to row or column, or -1 for words not in the matrix.
+        self._rows = np.full(len(table), -1, dtype=np.intp)
+        self._rows[guess_ids] = np.arange(len(guess_ids))
+        self._columns = np.full(len(table), -1, dtype=np.intp)
+        self._columns[solution_ids] = np.arange(len(solution_ids))
+        # Word to row or column, for scoring one pair without going through
+        # word IDs.
+        self._row_of = {table.words[i]: row for row, i in enumerate(guess_ids.tolist())}
+        self._column_of = {table.words[i]: column for column, i in enumerate(solution_ids.tolist())}
+
+    @classmethod
+    def build(
+        cls,
+        table: WordTable,
+        guess_ids: Optional[np.ndarray] = None,
+        solution_ids: Optional[np.ndarray] = None) -> "ScoreMatrix":
+        """
+        Scores guess_ids against solution_ids, by default every valid word
+        against every solution.
+        """
+
+        if guess_ids is None:
+            guess_ids = np.flatnonzero(table.is_valid)
+        if solution_ids is None:
+            solution_ids = np.flatnonzero(table.is_solution)
+        codes = score_codes(table.letters[guess_ids], table.letters[solution_ids])
+        return cls(table, guess_ids, solution_ids, codes)
+
+    @classmethod
+    def load_or_build(
+        cls,
+        table: WordTable,
+        guess_ids: Optional[np.ndarray] = None,
+        solution_ids: Optional[np.ndarray] = None,
+        cache_dir: Optional[str] = None,
+        num_workers: int = 0) -> "ScoreMatrix":
+        """
+        Like build(), but memory-maps the codes from a file in cache_dir
+        (default_cache_dir() by default) if an earlier call saved them
+        there, or else builds them there with build_score_file(). The file
+        name is a hash of the guesses, the solutions and cache_version, so
+        a change to any of them uses a new file.
+
+        The codes of a mapped matrix are read-only and shared, through the
+        page cache, by every process mapping the same file. If the cache
+        directory can't be written to, the matrix is built in memory
+        instead.
+        """
+
+        if guess_ids is None:
+            guess_ids = np.flatnonzero(table.is_valid)
+        if solution_ids is None:
+            solution_ids = np.flatnonzero(table.is_solution)
+        path = os.path.join(
+            cache_dir or default_cache_dir(),
+            f"score_matrix-v{cache_version}-{_cache_key(table, guess_ids, solution_ids)}.npy")
+
+        shape = (len(guess_ids), len(solution_ids))
+        codes = _load_codes(path, shape)
+        if codes is None:
+            guess_letters, solution_letters = table.letters[guess_ids], table.letters[solution_ids]
+            try:
+                codes = build_score_file(path, guess_letters, solution_letters, num_workers=num_workers)
+            except OSError:
+                codes = score_codes(guess_letters, solution_letters)
+        return cls(table, guess_ids, solution_ids, codes)
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes
+
+    def row_of(self, guess: str) -> int:
+        """
+        The row of guess, or -1 if it isn't a guess of the matrix.
+        """
+
+        return self._row_of.get(guess, -1)
+
+    def column_of(self, solution: str) -> int:
+        """
+        The column of solution, or -1 if it isn't a solution of the matrix.
+        """
+
+        return self._column_of.get(solution, -1)
+
+    def row_codes(self, guess: str, solution_ids: np.ndarray) -> Optional[np.ndarray]:
+        """
+        The codes of guess against the words with the given IDs, or None
+        if any of them isn't in the matrix.
+        """
+
+        row = self.row_of(guess)
+        columns = self._columns[solution_ids]
+        if row < 0 or (columns < 0).any():
+            return None
+        return self.codes[row, columns]
+
+    def code(self, guess: str, solution: str) -> int:
+        """
+        The pattern code of the pair. Raises KeyError if the pair isn't in
+        the matrix.
+        """
+
+        try:
+            return self.codes.item(self._row_of[guess], self._column_of[solution])
+        except KeyError:
+            raise KeyError((guess, solution)) from None
+
+    def score(self, guess: str, solution: str) -> str:
+        """
+        The score string of the pair, as _score_guess would return it.
+        Raises KeyError if the pair isn't in the matrix.
+        """
+
+        return pattern_strings[self.code(guess, solution)]
+
+
+def default_cache_dir() -> str:
+    cache_dir = os.environ.get("WORDLE_TOURNAMENTS_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "wordle_tournaments_client")
+
+
+def _cache_key(table: WordTable, guess_ids: np.ndarray, solution_ids: np.ndarray) -> str:
+    digest = hashlib.sha256(f"v{cache_version} {len(guess_ids)}x{len(solution_ids)}\n".encode("ascii"))
+    digest.update(np.ascontiguousarray(table.letters[guess_ids]).tobytes())
+    digest.update(np.ascontiguousarray(table.letters[solution_ids]).tobytes())
+    return digest.hexdigest()[:32]
+
+
+def _load_codes(path: str, shape: Tuple[int, int]) -> Optional[np.ndarray]:
+    # None if the file is missing or isn't a matrix of the expected shape.
+    try:
+        codes = np.load(path, mmap_mode="r", allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+    if codes.shape != shape or codes.dtype != np.uint8:
+        return None
+    return codes
+
+
+class LazyScoreMatrix:
+    """
+    Pattern codes of any guess against solutions given as word IDs of a
+    WordTable, by default every word of the table, for vocabularies whose
+    full ScoreMatrix is too big to keep.
+
+    A row, the codes of one guess against every solution, is computed with
+    score_many() the first time it is asked for, and kept in an LRU cache
+    of at most max_bytes. hits, misses and evictions count row lookups
+    answered from the cache, rows computed, and rows dropped to stay
+    within budget. It is safe to share between threads.
+    """
+
+    table: WordTable
+    solution_ids: np.ndarray
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+    def __init__(
+        self,
+        table: WordTable,
+        solution_ids: Optional[np.ndarray] = None,
+        max_bytes: int = 64 * 1024 * 1024) -> None:
+
+        if solution_ids is None:
+            solution_ids = np.arange(len(table))
+        self.table = table
+        self.solution_ids = solution_ids
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._solution_letters = table.letters[solution_ids]
+        self._columns = np.full(len(table), -1, dtype=np.intp)
+        self._columns[solution_ids] = np.arange(len(solution_ids))
+        self._column_of = {table.words[i]: column for column, i in enumerate(solution_ids.tolist())}
+        self._rows: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Bytes of rows in the cache.
+        """
+
+        return len(self._rows) * len(self.solution_ids)
+
+    def row(self, guess: str) -> np.ndarray:
+        """
+        The read-only codes of guess against every solution, in the order
+        of solution_ids.
+        """
+
+        with self._lock:
+            row = self._rows.get(guess)
+            if row is not None:
+                self._rows.move_to_end(guess)
+                self.hits += 1
+                return row
+            self.misses += 1
+
+        # Scored outside the lock, so that other threads' hits don't wait.
+        row = score_many(guess, self._solution_letters)
+        row.flags.writeable = False
+        if row.nbytes > self.max_bytes:
+            return row
+
+        with self._lock:
+            self._rows[guess] = row
+            self._rows.move_to_end(guess)
+            while self.nbytes > self.max_bytes:
+                self._rows.popitem(last=False)
+                self.evictions += 1
+        return row
+
+    def column_of(self, solution: str) -> int:
+        """
+        The column of solution, or -1 if it isn't a solution of the matrix.
+        """
+
+        return self._column_of.get(solution, -1)
+
+    def row_codes(self, guess: str, solution_ids: np.ndarray) -> Optional[np.ndarray]:
+        """
+        The codes of guess against the words with the given IDs, or None
+        if any of them isn't a solution of the matrix.
+        """
+
+        columns = self._columns[solution_ids]
+        if (columns < 0).any():
+            return None
+        return self.row(guess)[columns]
+
+    def code(self, guess: str, solution: str) -> int:
+        """
+        The pattern code of the pair. Raises KeyError if solution isn't a
+        solution of the matrix.
+        """
+
+        column = self.column_of(solution)
+        if column < 0 or len(guess) != word_length:
+            raise KeyError((guess, solution))
+        return self.row(guess).item(column)
+
+    def score(self, guess: str, solution: str) -> str:
+        return pattern_strings[self.code(guess, solution)]
+
+
+# Anything that filter_candidates() and the game runners can score with.
+ScoreSource = Union[ScoreMatrix, LazyScoreMatrix]
+
+
+def filter_candidates(
+    candidates: CandidateSet,
+    guess: str,
+    code: int,
+    score_matrix: Optional[ScoreSource] = None) -> CandidateSet:
+    """
+    The candidates that are still eligible once guess has scored code,
+    the words that solvers.is_eligible accepts.
+
+    By default they are found with get_letter_index() and
+    Constraint.from_code(). Given a score_matrix, a ScoreMatrix or a
+    LazyScoreMatrix, that covers the guess and every candidate, they are
+    found from the guess's row of codes instead.
+    """
+
+    table = candidates.table
+    if score_matrix is not None and score_matrix.table is table:
+        ids = candidates.ids()
+        codes = score_matrix.row_codes(guess, ids)
+        if codes is not None:
+            return CandidateSet.from_ids(table, ids[_eligible_codes(guess, code)[codes]])
+
+    from . import get_letter_index, get_word_table
+    constraint = Constraint.from_code(guess, code)
+    if table is get_word_table():
+        return get_letter_index().filter(candidates, constraint)
+    return candidates.filter(constraint.matches)
+
+
+@functools.lru_cache(maxsize=4096)
+def _eligible_codes(guess: str, code: int) -> np.ndarray:
+    # Whether the words that guess scores each pattern code against are
+    # eligible once it has scored code. Either all such words are or none
+    # are: a pattern says where they have the letters of guess, and how many
+    # of each letter of guess they have, exactly as many as its greens and
+    # yellows if the letter also has a gray, and at least that many
+    # otherwise.
+    constraint = Constraint.from_code(guess, code)
+    eligible = np.ones(len(pattern_strings), dtype=bool)
+    for i, _ in constraint.fixed:
+        eligible &= _pattern_marks[:, i] == 2
+    for i, _ in constraint.forbidden:
+        eligible &= _pattern_marks[:, i] != 2
+    for letter, n in constraint.min_counts:
+        marks = _pattern_marks[:, [i for i, c in enumerate(guess) if c == letter]]
+        eligible &= (marks > 0).sum(axis=1) >= n
+    for letter, n in constraint.max_counts:
+        marks = _pattern_marks[:, [i for i, c in enumerate(guess) if c == letter]]
+        eligible &= ((marks > 0).sum(axis=1) <= n) & (marks == 0).any(axis=1)
+    eligible.flags.writeable = False
+    return eligible
@@ -0,0 +1,236 @@
+import itertools
+import numpy as np
+import pytest
+from . import MemoryGameRunner, Solver, _score_guess, encode_score
+from .patterns import pattern_strings
+from .candidates import CandidateSet
+from .constraint import Constraint
+from .score_matrix import LazyScoreMatrix, ScoreMatrix, build_score_file, filter_candidates, score_codes, score_many, score_pairs
+from .word_table import WordTable, encode_letters
+
+# Words with repeated letters, where yellows are easy to get wrong.
+_words = ["cigar", "sissy", "eerie", "geese", "lever", "abbey", "babes", "kebab", "speed", "eager", "crane"]
+
+
+def test_score_codes_match_score_guess():
+    letters = encode_letters(_words)
+    codes = score_codes(letters, letters)
+
+    assert codes.dtype == np.uint8
+    for (i, guess), (j, solution) in itertools.product(enumerate(_words), repeat=2):
+        assert pattern_strings[codes[i, j]] == _score_guess(guess, solution), (guess, solution)
+
+
+def test_score_codes_in_blocks(monkeypatch):
+    from . import score_matrix
+    letters = encode_letters(_words)
+    expected = score_codes(letters, letters)
+
+    monkeypatch.setattr(score_matrix, "_block_size", 3)
+    assert (score_codes(letters, letters) == expected).all()
+
+
+def test_score_many():
+    codes = score_many("geese", _words)
+
+    assert codes.dtype == np.uint8
+    assert [pattern_strings[c] for c in codes] == [_score_guess("geese", w) for w in _words]
+    assert (score_many("geese", encode_letters(_words)) == codes).all()
+    assert score_many("geese", []).shape == (0,)
+
+
+def test_score_pairs():
+    pairs = list(itertools.product(_words, repeat=2))
+    codes = score_pairs([g for g, _ in pairs], [s for _, s in pairs])
+
+    assert [pattern_strings[c] for c in codes] == [_score_guess(g, s) for g, s in pairs]
+    # Broadcasting one solution against many guesses.
+    assert (score_pairs(_words, ["eerie"]) == score_codes(encode_letters(_words), encode_letters(["eerie"]))[:, 0]).all()
+
+
+def test_score_matrix():
+    table = WordTable(_words[:4], _words[4:], ["zonal"])
+    matrix = ScoreMatrix.build(table)
+
+    assert matrix.codes.shape == (len(_words), 4)
+    assert matrix.score("geese", "eerie") == _score_guess("geese", "eerie")
+    assert matrix.code("cigar", "cigar") == 242
+    assert matrix.row_of("zonal") == -1
+    assert matrix.column_of("lever") == -1
+    with pytest.raises(KeyError):
+        matrix.code("cigar", "lever")
+    with pytest.raises(KeyError):
+        matrix.code("bread", "cigar")
+
+
+def test_filter_candidates():
+    table = WordTable(_words, [], [])
+    matrix = ScoreMatrix.build(table)
+    partial = ScoreMatrix.build(table, solution_ids=np.arange(3))
+    candidates = CandidateSet.from_words(table, _words[1:])
+
+    for guess, solution in itertools.product(_words, _words[1:]):
+        score = _score_guess(guess, solution)
+        code = encode_score(score)
+        expected = Constraint.from_score(guess, score).filter(_words[1:])
+
+        assert filter_candidates(candidates, guess, code).words() == expected
+        assert filter_candidates(candidates, guess, code, matrix).words() == expected
+        # Falls back to the constraint for candidates the matrix doesn't have.
+        assert filter_candidates(candidates, guess, code, partial).words() == expected
+
+
+class _ListSolver(Solver):
+    def __init__(self, words):
+        self.words = words
+        self.reset()
+
+    def get_guess(self, last_guess, last_guess_valid, last_guess_score):
+        return self.remaining.pop(0), 0
+
+    def reset(self):
+        self.remaining = list(self.words)
+
+
+def test_memory_game_runner_with_score_matrix():
+    matrix = ScoreMatrix.build(WordTable(_words[:4], _words[4:], []))
+    guesses = ["bread", "eager", "geese"]
+
+    with_matrix = MemoryGameRunner("geese", _ListSolver(guesses), 10, matrix).play_game()
+    without = MemoryGameRunner("geese", _ListSolver(guesses), 10).play_game()
+
+    assert with_matrix == without
+    assert with_matrix.won
+
+
+def test_score_matrix_cache(tmp_path, monkeypatch):
+    from . import score_matrix
+    table = WordTable(_words[:4], _words[4:], [])
+    expected = ScoreMatrix.build(table).codes
+
+    built = ScoreMatrix.load_or_build(table, cache_dir=str(tmp_path))
+    [path] = tmp_path.iterdir()
+    assert path.name.startswith(f"score_matrix-v{score_matrix.cache_version}-")
+    assert isinstance(built.codes, np.memmap)
+    assert (built.codes == expected).all()
+
+    # A second load maps the file instead of scoring again.
+    monkeypatch.setattr(score_matrix, "score_codes", None)
+    loaded = ScoreMatrix.load_or_build(table, cache_dir=str(tmp_path))
+    assert isinstance(loaded.codes, np.memmap)
+    assert not loaded.codes.flags.writeable
+    assert (loaded.codes == expected).all()
+
+
+def test_score_matrix_cache_key(tmp_path):
+    ScoreMatrix.load_or_build(WordTable(_words[:4], _words[4:], []), cache_dir=str(tmp_path))
+    ScoreMatrix.load_or_build(WordTable(_words[:3], _words[3:], []), cache_dir=str(tmp_path))
+    ScoreMatrix.load_or_build(WordTable(_words[:4], _words[4:], []), cache_dir=str(tmp_path))
+
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_score_matrix_cache_ignores_bad_files(tmp_path):
+    table = WordTable(_words[:4], _words[4:], [])
+    ScoreMatrix.load_or_build(table, cache_dir=str(tmp_path))
+    [path] = tmp_path.iterdir()
+    path.write_bytes(b"not a matrix")
+
+    matrix = ScoreMatrix.load_or_build(table, cache_dir=str(tmp_path))
+    assert (matrix.codes == ScoreMatrix.build(table).codes).all()
+    assert path.read_bytes() != b"not a matrix"
+
+
+def test_score_matrix_cache_not_writable(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_bytes(b"")
+    table = WordTable(_words[:4], _words[4:], [])
+
+    matrix = ScoreMatrix.load_or_build(table, cache_dir=str(blocker / "cache"))
+    assert (matrix.codes == ScoreMatrix.build(table).codes).all()
+
+
+def test_default_cache_dir(monkeypatch):
+    from .score_matrix import default_cache_dir
+    monkeypatch.setenv("WORDLE_TOURNAMENTS_CACHE_DIR", "/tmp/scores")
+    assert default_cache_dir() == "/tmp/scores"
+    monkeypatch.delenv("WORDLE_TOURNAMENTS_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", "/tmp/cache")
+    assert default_cache_dir() == "/tmp/cache/wordle_tournaments_client"
+
+
+def test_lazy_score_matrix():
+    table = WordTable(_words, [], [])
+    full = ScoreMatrix.build(table, guess_ids=np.arange(len(table)), solution_ids=np.arange(len(table)))
+    # Room for two rows.
+    lazy = LazyScoreMatrix(table, max_bytes=2 * len(table))
+
+    assert (lazy.row("geese") == full.codes[full.row_of("geese")]).all()
+    assert lazy.code("geese", "eerie") == full.code("geese", "eerie")
+    assert lazy.score("eerie", "geese") == _score_guess("eerie", "geese")
+    assert (lazy.hits, lazy.misses, lazy.evictions) == (1, 2, 0)
+
+    lazy.row("sissy")
+    assert (lazy.hits, lazy.misses, lazy.evictions) == (1, 3, 1)
+    assert lazy.nbytes == 2 * len(table)
+    # "geese" was least recently used, so it was evicted.
+    lazy.row("geese")
+    assert (lazy.hits, lazy.misses, lazy.evictions) == (1, 4, 2)
+
+    # Guesses needn't be in the table.
+    assert lazy.score("zzzzz", "abbey") == _score_guess("zzzzz", "abbey")
+    with pytest.raises(KeyError):
+        lazy.code("geese", "zzzzz")
+
+
+def test_lazy_score_matrix_rows_over_budget():
+    table = WordTable(_words, [], [])
+    lazy = LazyScoreMatrix(table, max_bytes=1)
+
+    lazy.row("geese")
+    lazy.row("geese")
+    assert (lazy.hits, lazy.misses, lazy.evictions, lazy.nbytes) == (0, 2, 0, 0)
+
+
+def test_filter_candidates_with_lazy_score_matrix():
+    table = WordTable(_words, [], [])
+    lazy = LazyScoreMatrix(table, solution_ids=np.arange(1, len(table)))
+    candidates = CandidateSet.from_words(table, _words[1:])
+    code = encode_score(_score_guess("geese", "eerie"))
+
+    assert filter_candidates(candidates, "geese", code, lazy) == filter_candidates(candidates, "geese", code)
+    assert lazy.misses == 1
+    # Candidates outside the lazy matrix's solutions are checked directly.
+    filter_candidates(CandidateSet.from_words(table, _words), "geese", code, lazy)
+    assert lazy.misses == 1
+
+
+@pytest.mark.parametrize("max_memory, num_workers", [(1 << 20, 0), (1, 0), (200, 2)])
+def test_build_score_file(tmp_path, max_memory, num_workers):
+    letters = encode_letters(_words)
+    path = str(tmp_path / "scores.npy")
+
+    codes = build_score_file(path, letters, letters[2:], max_memory, num_workers)
+
+    assert isinstance(codes, np.memmap)
+    assert not codes.flags.writeable
+    assert (codes == score_codes(letters, letters[2:])).all()
+    assert [p.name for p in tmp_path.iterdir()] == ["scores.npy"]
+
+
+def test_build_score_file_memory_is_bounded(tmp_path):
+    import tracemalloc
+    rng = np.random.default_rng(0)
+    letters = rng.integers(0, 26, size=(3000, 5), dtype=np.uint8)
+    max_memory = 1 << 20
+
+    tracemalloc.start()
+    try:
+        codes = build_score_file(str(tmp_path / "scores.npy"), letters, letters, max_memory)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # The 9MB matrix itself lives in the mapped file.
+    assert peak < 2 * max_memory
+    assert (codes[::100] == score_codes(letters[::100], letters)).all()
@@ -0,0 +1,134 @@
+"""
+Shares a ScoreMatrix and its WordTable between processes through one
+multiprocessing.shared_memory block, so that process-pool workers attach to
+the parent's arrays by name instead of each loading the word lists and
+building or mapping their own tables.
+
+    with SharedScoreTables(get_score_matrix()) as shared:
+        with ProcessPoolExecutor(
+                initializer=use_shared_score_tables,
+                initargs=(shared.handle,)) as executor:
+            ...
+
+In the workers, get_word_table() and get_score_matrix() then return the
+shared tables.
+"""
+
+import sys
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Tuple
+import numpy as np
+from .score_matrix import ScoreMatrix
+from .word_table import WordTable
+
+# Offsets of the arrays in the block are multiples of this.
+_alignment = 64
+
+# Attached blocks, kept open for as long as the process uses their arrays.
+_attached: Dict[str, Tuple[shared_memory.SharedMemory, ScoreMatrix]] = {}
+
+
+@dataclass(frozen=True)
+class SharedTablesHandle:
+    """
+    What a worker needs to attach to a SharedScoreTables. Small and
+    picklable, to pass as a pool initializer argument.
+    """
+
+    name: str
+    # (array name, dtype, shape, offset) of each array in the block.
+    layout: Tuple[Tuple[str, str, Tuple[int, ...], int], ...]
+
+
+class SharedScoreTables:
+    """
+    Copies a ScoreMatrix and its WordTable into a new shared memory block.
+    The block is removed by close(), or on leaving the with block; workers
+    must have finished with it by then.
+    """
+
+    handle: SharedTablesHandle
+
+    def __init__(self, score_matrix: ScoreMatrix) -> None:
+        table = score_matrix.table
+        arrays = {
+            "letters": table.letters,
+            "is_solution": table.is_solution,
+            "is_valid": table.is_valid,
+            "is_scrabble": table.is_scrabble,
+            "guess_ids": score_matrix.guess_ids,
+            "solution_ids": score_matrix.solution_ids,
+            "codes": score_matrix.codes,
+        }
+
+        layout: List[Tuple[str, str, Tuple[int, ...], int]] = []
+        size = 0
+        for name, array in arrays.items():
+            layout.append((name, array.dtype.str, array.shape, size))
+            size += -(-array.nbytes // _alignment) * _alignment
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.handle = SharedTablesHandle(self._shm.name, tuple(layout))
+        try:
+            for name, view in _views(self._shm, self.handle).items():
+                view[...] = arrays[name]
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedScoreTables":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def attach_score_tables(handle: SharedTablesHandle) -> ScoreMatrix:
+    """
+    The ScoreMatrix published as handle, over read-only views of the shared
+    block. Attaches once per process, which should be a child process of
+    the one that published the tables.
+    """
+
+    if handle.name in _attached:
+        return _attached[handle.name][1]
+
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(handle.name, track=False)
+    else:
+        # Before 3.13 this registers the block with the resource tracker,
+        # which removes it when the tracker exits. Pool workers share their
+        # parent's tracker, so that is only once the parent has exited.
+        shm = shared_memory.SharedMemory(handle.name)
+
+    views = _views(shm, handle)
+    table = WordTable.from_arrays(
+        views["letters"], views["is_solution"], views["is_valid"], views["is_scrabble"])
+    for name in ("guess_ids", "solution_ids", "codes"):
+        views[name].flags.writeable = False
+    score_matrix = ScoreMatrix(table, views["guess_ids"], views["solution_ids"], views["codes"])
+    _attached[handle.name] = (shm, score_matrix)
+    return score_matrix
+
+
+def use_shared_score_tables(handle: SharedTablesHandle) -> None:
+    """
+    Attaches to handle and makes get_word_table() and get_score_matrix()
+    return the shared tables in this process. Meant as a process pool
+    initializer.
+    """
+
+    from . import _use_score_matrix
+    _use_score_matrix(attach_score_tables(handle))
+
+
+def _views(shm: shared_memory.SharedMemory, handle: SharedTablesHandle) -> Dict[str, np.ndarray]:
+    return {
+        name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+        for name, dtype, shape, offset in handle.layout
+    }
@@ -0,0 +1,89 @@
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from multiprocessing import shared_memory
+from .score_matrix import ScoreMatrix
+from .shared_tables import SharedScoreTables, attach_score_tables, use_shared_score_tables
+from .word_table import WordTable
+
+
+def _small_matrix() -> ScoreMatrix:
+    table = WordTable(["cigar", "rebut", "sissy"], ["geese", "eerie"], ["eerie"])
+    return ScoreMatrix.build(table)
+
+
+def _worker_view(seed: int):
+    # Runs in a spawned worker initialized with use_shared_score_tables.
+    import wordle_tournaments_client as package
+    matrix = package.get_score_matrix()
+    return (
+        package.get_word_table() is matrix.table,
+        matrix.table.words,
+        matrix.score("geese", "sissy"),
+        "wordle_tournaments_client.wordle_valid_words" in sys.modules,
+    )
+
+
+def _check_attached(handle, matrix: ScoreMatrix) -> bool:
+    # Runs in a spawned worker, so that the attached block doesn't outlive
+    # the test in this process.
+    attached = attach_score_tables(handle)
+
+    assert attached is attach_score_tables(handle)
+    assert attached.table.words == matrix.table.words
+    assert attached.table.id_of("eerie") == matrix.table.id_of("eerie")
+    assert (attached.table.is_scrabble == matrix.table.is_scrabble).all()
+    assert (attached.codes == matrix.codes).all()
+    assert attached.score("geese", "sissy") == matrix.score("geese", "sissy")
+    with pytest.raises(ValueError):
+        attached.codes[0, 0] = 0
+    return True
+
+
+def test_attach_score_tables():
+    matrix = _small_matrix()
+    with SharedScoreTables(matrix) as shared, ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        assert executor.submit(_check_attached, shared.handle, matrix).result()
+
+
+def test_shared_score_tables_in_worker_processes():
+    matrix = _small_matrix()
+    with SharedScoreTables(matrix) as shared, ProcessPoolExecutor(
+            max_workers=2,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=use_shared_score_tables,
+            initargs=(shared.handle,)) as executor:
+        results = list(executor.map(_worker_view, range(4)))
+
+    assert results == [(True, matrix.table.words, matrix.score("geese", "sissy"), False)] * 4
+
+
+def test_shared_score_tables_close_removes_block():
+    shared = SharedScoreTables(_small_matrix())
+    name = shared.handle.name
+    shared.close()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name)
+
+
+def test_shared_score_tables_removes_block_on_error(monkeypatch):
+    created = []
+    original = shared_memory.SharedMemory
+
+    def record(*args, **kwargs):
+        shm = original(*args, **kwargs)
+        created.append(shm.name)
+        return shm
+
+    def fail(*args):
+        raise RuntimeError("copy failed")
+
+    monkeypatch.setattr(shared_memory, "SharedMemory", record)
+    monkeypatch.setattr("wordle_tournaments_client.shared_tables._views", fail)
+    with pytest.raises(RuntimeError):
+        SharedScoreTables(_small_matrix())
+    monkeypatch.undo()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(created[0])
@@ -0,0 +1,141 @@
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Set
+from . import CompleteGamesGuess, CreateCompleteGameArgs, _complete_game_args_to_dict
+
+
+@dataclass()
+class JournalState:
+    user_id: Optional[int] = None
+    # Solved games that have not been acknowledged by the server, by seed.
+    pending: Dict[int, CreateCompleteGameArgs] = field(default_factory=dict)
+    acknowledged: Set[int] = field(default_factory=set)
+
+
+class GameJournal:
+    """
+    Append-only JSONL record of a tournament.
+
+    Each solved game is written before it is uploaded and acknowledged once
+    the server has accepted it, so after a crash or an outage the games that
+    still need uploading can be read back with load(). Auth codes are not
+    written to the journal.
+    """
+
+    path: str
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record_user(self, user_id: int) -> None:
+        self._append({"event": "user", "user_id": user_id})
+
+    def record_solved(self, args: CreateCompleteGameArgs) -> None:
+        args_dict = _complete_game_args_to_dict(args)
+        del args_dict["auth_code"]
+        self._append({"event": "solved", "args": args_dict})
+
+    def record_acknowledged(self, seed: int, game_id: int) -> None:
+        self._append({"event": "acknowledged", "seed": seed, "game_id": game_id})
+
+    def load(self, auth_code: str = "") -> JournalState:
+        state = JournalState()
+        if not os.path.exists(self.path):
+            return state
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A write cut short by a crash; everything after it is lost.
+                    break
+
+                event = entry["event"]
+                if event == "user":
+                    state.user_id = entry["user_id"]
+                elif event == "solved":
+                    args = _args_from_json(entry["args"], auth_code)
+                    if args.seed not in state.acknowledged:
+                        state.pending[args.seed] = args
+                elif event == "acknowledged":
+                    state.pending.pop(entry["seed"], None)
+                    state.acknowledged.add(entry["seed"])
+
+        return state
+
+    def _append(self, entry: Dict) -> None:
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+
+def _args_from_json(json: Dict, auth_code: str) -> CreateCompleteGameArgs:
+    return CreateCompleteGameArgs(
+        auth_code=auth_code,
+        user_id=json["user_id"],
+        seed=json["seed"],
+        solution=json["solution"],
+        status=json["status"],
+        guesses=[CompleteGamesGuess(**g) for g in json["guesses"]])
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing server.
+
+    After failure_threshold consecutive failures the breaker opens and
+    allow_request() returns False for reset_timeout seconds. After that a
+    single trial request is let through; its success closes the breaker and
+    its failure opens it again.
+    """
+
+    failure_threshold: int
+    reset_timeout: float
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic) -> None:
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._num_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_in_flight or self._clock() - self._opened_at < self.reset_timeout:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._num_failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._num_failures += 1
+            if self._trial_in_flight or self._num_failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
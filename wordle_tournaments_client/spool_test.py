@@ -0,0 +1,101 @@
+import pytest
+import requests
+from . import CompleteGamesGuess, CreateCompleteGameArgs, TournamentRunner, User
+from .spool import CircuitBreaker, GameJournal
+from .stand_in_server import StandInServer
+from .tournament_test import FixedGuessSolver
+
+
+def test_journal_load(tmp_path):
+    journal = GameJournal(str(tmp_path / "journal.jsonl"))
+    assert journal.load().user_id is None
+
+    journal.record_user(3)
+    for seed in range(3):
+        guesses = [CompleteGamesGuess("cigar", "ggggg", 0)]
+        journal.record_solved(CreateCompleteGameArgs("secret", 3, seed, "cigar", 1, guesses))
+    journal.record_acknowledged(1, 100)
+    # A line cut short by a crash is ignored.
+    with open(journal.path, "a") as f:
+        f.write('{"event": "ackno')
+
+    state = journal.load("token")
+    assert state.user_id == 3
+    assert sorted(state.pending) == [0, 2]
+    assert state.acknowledged == {1}
+    assert state.pending[2].auth_code == "token"
+    assert state.pending[2].guesses == [CompleteGamesGuess("cigar", "ggggg", 0)]
+    with open(journal.path) as f:
+        assert "secret" not in f.read()
+
+
+def test_circuit_breaker():
+    now = 0.0
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0, clock=lambda: now)
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert not breaker.allow_request()
+
+    now = 10.0
+    assert breaker.allow_request()
+    # Only one trial request while half-open.
+    assert not breaker.allow_request()
+    breaker.record_failure()
+    assert not breaker.allow_request()
+
+    now = 20.0
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.allow_request()
+    assert not breaker.is_open
+
+
+def test_resume_uploads_spooled_games(tmp_path):
+    journal_path = str(tmp_path / "journal.jsonl")
+
+    with StandInServer() as server:
+        runner = TournamentRunner(
+            FixedGuessSolver(["cigar"]), "token", "name", "description",
+            server.url, 0, 9, 3, journal_path)
+
+        # The server goes down after seed 4.
+        create_complete_game = runner.client.create_complete_game
+        def flaky_create_complete_game(args):
+            if args.seed >= 5:
+                raise requests.ConnectionError("server down")
+            return create_complete_game(args)
+        runner.client.create_complete_game = flaky_create_complete_game
+
+        runner.play_tournament()
+        assert [g["seed"] for g in server.games] == list(range(5))
+        assert runner.circuit_breaker.is_open
+
+        solver = FixedGuessSolver(["cigar"])
+        resumed = TournamentRunner(
+            solver, "token", "name", "description",
+            server.url, 0, 14, 3, journal_path)
+        resumed.resume(num_upload_workers=2)
+
+        assert sorted(g["seed"] for g in server.games) == list(range(15))
+        assert {g["user_id"] for g in server.games} == {1}
+        assert len(server.state.users) == 1
+        assert sorted(GameJournal(journal_path).load().acknowledged) == list(range(15))
+
+
+def test_rejected_upload_is_not_spooled(tmp_path):
+    journal_path = str(tmp_path / "journal.jsonl")
+
+    with StandInServer() as server:
+        runner = TournamentRunner(
+            FixedGuessSolver(["cigar"]), "token", "name", "description",
+            server.url, 0, 4, 3, journal_path)
+        # Upload as a user the server does not know, so every upload gets a 400.
+        runner.client.create_user = lambda name, description: User(1234, description)
+
+        with pytest.raises(requests.HTTPError):
+            runner.play_tournament()
+
+        assert server.games == []
+        assert not runner.circuit_breaker.is_open
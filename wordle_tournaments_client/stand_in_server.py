@@ -0,0 +1,354 @@
+"""
+Stdlib-only stand-in for the wordle-tournaments API.
+
+Serves /user, /completegame and /completegames from memory, and can inject
+latency, errors and throttling so that Client and TournamentRunner can be
+load tested without a real server. Run it on its own with
+
+    python -m wordle_tournaments_client.stand_in_server --port 3000
+"""
+
+import argparse
+import gzip
+import json
+import math
+import random
+import socket
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+@dataclass(frozen=True)
+class FaultConfig:
+    # Seconds added to every response, plus a random extra of up to
+    # latency_jitter seconds.
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    # Fraction of requests answered with error_status instead of handled.
+    error_rate: float = 0.0
+    error_status: int = 503
+    # Requests beyond this rate are answered with 429 and a Retry-After
+    # header. None means no limit.
+    max_requests_per_second: Optional[float] = None
+    # Seed for the random choices above, so that runs are repeatable.
+    seed: int = 0
+
+
+class _State:
+    lock: threading.Lock
+    users: Dict[int, Dict[str, Any]]
+    games: List[Dict[str, Any]]
+    games_by_idempotency_key: Dict[str, Dict[str, Any]]
+    # Statuses to answer the next requests with, instead of handling them.
+    scripted_failures: List[int]
+    # If false, compressed request bodies are rejected with 415.
+    accept_compression: bool
+    num_connections: int
+    num_requests: int
+    # Request body bytes as sent over the wire, before decompression.
+    num_body_bytes: int
+    num_injected_errors: int
+    num_throttled: int
+    faults: FaultConfig
+    random: random.Random
+    # Token bucket for max_requests_per_second.
+    tokens: float
+    tokens_updated_at: float
+
+    def __init__(self, faults: FaultConfig) -> None:
+        self.lock = threading.Lock()
+        self.faults = faults
+        self.random = random.Random(faults.seed)
+        self.tokens = faults.max_requests_per_second or 0.0
+        self.tokens_updated_at = time.monotonic()
+        self.users = {}
+        self.games = []
+        self.games_by_idempotency_key = {}
+        self.scripted_failures = []
+        self.accept_compression = True
+        self.num_connections = 0
+        self.num_requests = 0
+        self.num_body_bytes = 0
+        self.num_injected_errors = 0
+        self.num_throttled = 0
+
+    def take_token(self) -> float:
+        """
+        Returns 0 if a request may go ahead under max_requests_per_second,
+        or else the number of seconds until it could. Call with lock held.
+        """
+
+        rate = self.faults.max_requests_per_second
+        if rate is None:
+            return 0.0
+
+        now = time.monotonic()
+        self.tokens = min(rate, self.tokens + (now - self.tokens_updated_at) * rate)
+        self.tokens_updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / rate
+
+
+class _UnsupportedEncoding(Exception):
+    pass
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so that clients can keep connections alive between requests.
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def setup(self) -> None:
+        super().setup()
+        # Headers and body go out in separate writes; without this, Nagle's
+        # algorithm and delayed ACKs add ~40ms to every kept-alive request.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.state.lock:
+            self.server.state.num_connections += 1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        state = self.server.state
+        faults = state.faults
+        with state.lock:
+            state.num_requests += 1
+            failure = state.scripted_failures.pop(0) if state.scripted_failures else None
+            retry_after = state.take_token() if failure is None else 0.0
+            if retry_after:
+                state.num_throttled += 1
+            elif failure is None and faults.error_rate and state.random.random() < faults.error_rate:
+                failure = faults.error_status
+                state.num_injected_errors += 1
+            delay = faults.latency + state.random.uniform(0, faults.latency_jitter)
+
+        if delay:
+            time.sleep(delay)
+
+        if retry_after:
+            self._read_body()
+            self._send_json(
+                429, {"error": "too many requests"}, {"Retry-After": str(math.ceil(retry_after))})
+            return
+
+        try:
+            self._route(failure)
+        except _UnsupportedEncoding as e:
+            self._send_json(415, {"error": f"unsupported content encoding {e}"})
+
+    def _route(self, failure: Optional[int]) -> None:
+        url = urlparse(self.path)
+        if failure:
+            self._read_body()
+            self._send_json(failure, {"error": "scripted failure"})
+        elif url.path == "/api/user":
+            self._create_user(parse_qs(url.query))
+        elif url.path == "/api/completegame":
+            args = self._read_json()
+            args["idempotency_key"] = self.headers.get("Idempotency-Key")
+            self._create_complete_game(args)
+        elif url.path == "/api/completegames":
+            self._create_complete_games(self._read_json())
+        else:
+            self._send_json(404, {"error": f"unknown route {url.path}"})
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length", 0))
+        with self.server.state.lock:
+            self.server.state.num_body_bytes += length
+        return self.rfile.read(length)
+
+    def _read_json(self) -> Any:
+        body = self._read_body()
+        encoding = self.headers.get("Content-Encoding", "identity").lower()
+        if encoding != "identity" and not self.server.state.accept_compression:
+            raise _UnsupportedEncoding(encoding)
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+        elif encoding != "identity":
+            raise _UnsupportedEncoding(encoding)
+        return json.loads(body)
+
+    def _send_json(self, status: int, body: Any, headers: Dict[str, str] = {}) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _create_user(self, params: Dict[str, List[str]]) -> None:
+        state = self.server.state
+        with state.lock:
+            user_id = len(state.users) + 1
+            user = {
+                "user_id": user_id,
+                "name": params.get("name", [""])[0],
+                "description": params.get("description", [""])[0],
+            }
+            state.users[user_id] = user
+        self._send_json(200, user)
+
+    def _create_complete_game(self, args: Dict[str, Any]) -> None:
+        game = self._add_game(args)
+        if game is None:
+            self._send_json(400, {"error": "unknown user"})
+            return
+        self._send_json(200, game)
+
+    def _create_complete_games(self, body: Dict[str, Any]) -> None:
+        results: List[Dict[str, Any]] = []
+        for args in body["games"]:
+            game = self._add_game(args)
+            results.append({"game": game} if game else {"error": "unknown user"})
+        self._send_json(200, {"results": results})
+
+    def _add_game(self, args: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        state = self.server.state
+        key = args.get("idempotency_key")
+        with state.lock:
+            if args.get("user_id") not in state.users:
+                return None
+            if key and key in state.games_by_idempotency_key:
+                return state.games_by_idempotency_key[key]
+
+            game = {
+                "game_id": len(state.games) + 1,
+                "user_id": args["user_id"],
+                "seed": args["seed"],
+                "solution": args["solution"],
+                "guesses": args["guesses"],
+                "num_guesses": len(args["guesses"]),
+                "status": args["status"],
+            }
+            state.games.append(game)
+            if key:
+                state.games_by_idempotency_key[key] = game
+            return game
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    state: _State
+
+
+class StandInServer:
+    """
+    In-process fake of the wordle-tournaments API.
+
+    Listens on localhost in a background thread. Use as a context manager
+    and point a Client or TournamentRunner at `url`.
+    """
+
+    state: _State
+    _server: _Server
+    _thread: Optional[threading.Thread]
+
+    def __init__(
+        self,
+        port: int = 0,
+        accept_compression: bool = True,
+        faults: FaultConfig = FaultConfig(),
+        host: str = "127.0.0.1") -> None:
+
+        self.state = _State(faults)
+        self.state.accept_compression = accept_compression
+        self._server = _Server((host, port), _Handler)
+        self._server.state = self.state
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        host = host.decode("ascii") if isinstance(host, bytes) else host
+        return f"http://{host}:{port}/api"
+
+    @property
+    def games(self) -> List[Dict[str, Any]]:
+        return self.state.games
+
+    @property
+    def num_connections(self) -> int:
+        return self.state.num_connections
+
+    @property
+    def num_requests(self) -> int:
+        return self.state.num_requests
+
+    def set_faults(self, faults: FaultConfig) -> None:
+        """
+        Changes the injected faults of a running server.
+        """
+
+        with self.state.lock:
+            self.state.faults = faults
+            self.state.random = random.Random(faults.seed)
+            self.state.tokens = faults.max_requests_per_second or 0.0
+            self.state.tokens_updated_at = time.monotonic()
+
+    def start(self) -> None:
+        # A short poll interval keeps stop() fast.
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a stand-in wordle-tournaments API server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--max-requests-per-second", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    faults = FaultConfig(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        max_requests_per_second=args.max_requests_per_second,
+        seed=args.seed)
+    server = StandInServer(args.port, faults=faults, host=args.host)
+    print(f"serving on {server.url}")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import time
+from . import Client, RetryPolicy, TournamentRunner
+from .stand_in_server import FaultConfig, StandInServer
+from .tournament_test import FixedGuessSolver
+
+
+def test_injected_errors_are_retried():
+    retry_policy = RetryPolicy(max_attempts=10, backoff_base=0.001)
+    with StandInServer() as server:
+        client = Client("token", server.url, retry_policy=retry_policy)
+
+        # create_user is not retried on 503, so only inject errors once the
+        # user exists.
+        create_user = client.create_user
+        def create_user_then_inject_errors(name, description):
+            user = create_user(name, description)
+            server.set_faults(FaultConfig(error_rate=0.3))
+            return user
+        client.create_user = create_user_then_inject_errors
+
+        runner = TournamentRunner(
+            FixedGuessSolver(["cigar"]), "token", "name", "description",
+            seed_start=0, seed_end=29, max_num_turns=3, client=client)
+        runner.play_tournament()
+
+        assert sorted(g["seed"] for g in server.games) == list(range(30))
+        assert server.state.num_injected_errors > 0
+
+
+def test_latency():
+    with StandInServer(faults=FaultConfig(latency=0.05)) as server, Client("token", server.url) as client:
+        start = time.monotonic()
+        client.create_user("name", "description")
+        assert time.monotonic() - start >= 0.05
+
+
+def test_throttling():
+    faults = FaultConfig(max_requests_per_second=2)
+    retry_policy = RetryPolicy(max_attempts=1)
+    with StandInServer(faults=faults) as server, Client("token", server.url, retry_policy=retry_policy) as client:
+        statuses = [client.session.post(f"{server.url}/user").status_code for _ in range(10)]
+
+        assert statuses.count(200) == 2
+        assert statuses.count(429) == 8
+        assert server.state.num_throttled == 8
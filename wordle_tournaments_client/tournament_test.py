@@ -0,0 +1,66 @@
+import pytest
+import requests
+from typing import List, Tuple
+from . import Solver, TournamentRunner, User
+from .stand_in_server import StandInServer
+
+
+class FixedGuessSolver(Solver):
+    guesses: List[str]
+    next_guess_index: int
+
+    def __init__(self, guesses: List[str]):
+        self.guesses = guesses
+        self.next_guess_index = 0
+
+    def get_guess(
+        self,
+        last_guess: str,
+        last_guess_valid: bool,
+        last_guess_score: str) -> Tuple[str, int]:
+
+        word = self.guesses[self.next_guess_index]
+        self.next_guess_index = (self.next_guess_index + 1) % len(self.guesses)
+        return word, 5
+
+    def reset(self) -> None:
+        self.next_guess_index = 0
+
+
+def test_play_tournament():
+    with StandInServer() as server:
+        solver = FixedGuessSolver(["cigar", "rebut"])
+        runner = TournamentRunner(solver, "token", "name", "description", server.url, 0, 9, 3)
+        runner.play_tournament()
+
+        assert [g["seed"] for g in server.games] == list(range(10))
+        assert [g["status"] for g in server.games[:2]] == [1, 1]
+        assert server.games[2]["status"] == 2
+
+
+def test_play_tournament_pipelined(capsys):
+    with StandInServer() as server:
+        solver = FixedGuessSolver(["cigar", "rebut"])
+        runner = TournamentRunner(solver, "token", "name", "description", server.url, 0, 49, 3)
+        runner.play_tournament(num_upload_workers=4, upload_queue_size=2)
+
+        assert sorted(g["seed"] for g in server.games) == list(range(50))
+
+    reported_seeds = [
+        int(line.split("seed =")[1].split(",")[0])
+        for line in capsys.readouterr().out.splitlines()
+    ]
+    assert reported_seeds == list(range(50))
+
+
+def test_play_tournament_pipelined_error():
+    with StandInServer() as server:
+        solver = FixedGuessSolver(["cigar"])
+        runner = TournamentRunner(solver, "token", "name", "description", server.url, 0, 49, 3)
+        # Upload as a user the server does not know, so every upload is rejected.
+        runner.client.create_user = lambda name, description: User(1234, description)
+
+        with pytest.raises(requests.HTTPError):
+            runner.play_tournament(num_upload_workers=2, upload_queue_size=2)
+
+        assert server.games == []
@@ -0,0 +1,117 @@
+"""
+Integer IDs and letter arrays for the vocabulary, for vectorized scoring
+and filtering. Needs numpy, which is the `numpy` extra of this package.
+"""
+
+from typing import Dict, Iterable, Sequence, Tuple
+import numpy as np
+
+word_length = 5
+
+
+def encode_letters(words: Sequence[str]) -> np.ndarray:
+    """
+    Returns a len(words)×5 uint8 array with a code in 0..25 for each
+    letter of each word.
+    """
+
+    if not words:
+        return np.zeros((0, word_length), dtype=np.uint8)
+    data = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    if len(data) != len(words) * word_length:
+        raise ValueError(f"not all words are {word_length} letters long")
+    letters = data.reshape(len(words), word_length) - ord("a")
+    if letters.max() >= 26:
+        raise ValueError("words must be lowercase a-z")
+    return letters
+
+
+class WordTable:
+    """
+    Every word of the solution, valid and scrabble lists, plus any custom
+    words, numbered from 0 in that order. Solutions come first, so the IDs
+    of the built-in lists don't change when custom words are registered.
+
+    `letters` holds the letter codes of word i in row i, and `is_solution`,
+    `is_valid` and `is_scrabble` flag which lists each word is on.
+    is_valid is true for solutions, valid words and custom words, matching
+    get_valid_wordle_words(); is_scrabble matches
+    get_valid_scrabble_words().
+    """
+
+    words: Tuple[str, ...]
+    letters: np.ndarray
+    is_solution: np.ndarray
+    is_valid: np.ndarray
+    is_scrabble: np.ndarray
+
+    def __init__(
+        self,
+        solution_words: Sequence[str],
+        valid_words: Sequence[str],
+        scrabble_words: Sequence[str],
+        custom_words: Sequence[str] = ()) -> None:
+
+        ids: Dict[str, int] = {}
+        for source in (solution_words, valid_words, scrabble_words, custom_words):
+            for word in source:
+                ids.setdefault(word, len(ids))
+
+        self.words = tuple(ids)
+        self._ids = ids
+        self.letters = encode_letters(self.words)
+        self.is_solution = self._flags(solution_words)
+        self.is_valid = self._flags(valid_words) | self.is_solution | self._flags(custom_words)
+        self.is_scrabble = self._flags(scrabble_words) & self.is_valid
+
+        # The table is shared through get_word_table(), so keep it read-only.
+        for array in (self.letters, self.is_solution, self.is_valid, self.is_scrabble):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_arrays(
+        cls,
+        letters: np.ndarray,
+        is_solution: np.ndarray,
+        is_valid: np.ndarray,
+        is_scrabble: np.ndarray) -> "WordTable":
+        """
+        A table over existing arrays, such as those of another table shared
+        between processes. The arrays are used as they are, not copied.
+        """
+
+        text = (letters + ord("a")).astype(np.uint8).tobytes().decode("ascii")
+        table = cls.__new__(cls)
+        table.words = tuple(text[i:i + word_length] for i in range(0, len(text), word_length))
+        table._ids = {word: i for i, word in enumerate(table.words)}
+        table.letters = letters
+        table.is_solution = is_solution
+        table.is_valid = is_valid
+        table.is_scrabble = is_scrabble
+        for array in (letters, is_solution, is_valid, is_scrabble):
+            array.flags.writeable = False
+        return table
+
+    def _flags(self, words: Sequence[str]) -> np.ndarray:
+        flags = np.zeros(len(self.words), dtype=bool)
+        flags[self.ids_of(words)] = True
+        return flags
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self._ids
+
+    def id_of(self, word: str) -> int:
+        """
+        Raises KeyError if word is not in the table.
+        """
+
+        return self._ids[word]
+
+    def ids_of(self, words: Iterable[str]) -> np.ndarray:
+        return np.array([self._ids[word] for word in words], dtype=np.intp)
+
+    def word_of(self, id: int) -> str:
+        return self.words[id]
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from . import get_valid_scrabble_words, get_valid_wordle_words, get_word_table, wordle_solution_words
+from .word_table import WordTable, encode_letters
+
+
+def test_encode_letters():
+    assert encode_letters(["abcde", "zzzzz"]).tolist() == [[0, 1, 2, 3, 4], [25] * 5]
+    assert encode_letters([]).shape == (0, 5)
+    with pytest.raises(ValueError):
+        encode_letters(["abc"])
+    with pytest.raises(ValueError):
+        encode_letters(["ABCDE"])
+
+
+def test_word_table():
+    table = WordTable(["cigar", "rebut"], ["aahed", "cigar"], ["zonal", "aahed"], ["qqqqq"])
+
+    assert table.words == ("cigar", "rebut", "aahed", "zonal", "qqqqq")
+    assert len(table) == 5
+    assert "zonal" in table and "bread" not in table
+    assert table.id_of("aahed") == 2
+    assert table.word_of(3) == "zonal"
+    assert table.ids_of(["qqqqq", "cigar"]).tolist() == [4, 0]
+    assert table.letters[1].tolist() == [17, 4, 1, 20, 19]
+    assert table.is_solution.tolist() == [True, True, False, False, False]
+    assert table.is_valid.tolist() == [True, True, True, False, True]
+    assert table.is_scrabble.tolist() == [False, False, True, False, False]
+    with pytest.raises(KeyError):
+        table.id_of("bread")
+    with pytest.raises(ValueError):
+        table.letters[0, 0] = 1
+
+
+def test_get_word_table():
+    table = get_word_table()
+    assert table is get_word_table()
+
+    assert table.words[:len(wordle_solution_words)] == tuple(wordle_solution_words)
+    assert {table.words[i] for i in np.flatnonzero(table.is_valid)} == get_valid_wordle_words()
+    assert [table.words[i] for i in np.flatnonzero(table.is_scrabble)] == sorted(
+        get_valid_scrabble_words(), key=table.id_of)
+    assert table.letters.shape == (len(table), 5)
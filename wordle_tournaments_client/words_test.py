@@ -1,5 +1,6 @@
+import pytest
 from operator import not_
-from . import wordle_solution_words, get_valid_scrabble_words, get_valid_wordle_words
+from . import wordle_solution_words, get_valid_scrabble_words, get_valid_wordle_words, get_word_table
 
 
 def test_all_wordle_solutions_are_valid():
@@ -13,3 +14,54 @@ def test_all_scrabble_words_are_valid():
     for word in get_valid_scrabble_words():
         assert word in valid_set
     
+
+
+def test_packed_word_lists():
+    from . import wordle_solution_words_packed, wordle_valid_words_packed, scrabble_words_packed
+
+    assert len(wordle_solution_words_packed) == 2315
+    assert len(wordle_valid_words_packed) == 10657
+    assert len(scrabble_words_packed) == 8636
+    assert len(wordle_valid_words_packed.buffer) == 5 * 10657
+
+    assert wordle_solution_words_packed.words() == wordle_solution_words
+    assert wordle_solution_words_packed[0] == "cigar"
+    assert wordle_solution_words_packed[-1] == wordle_solution_words[-1]
+    assert bytes(wordle_solution_words_packed.buffer[:5]) == b"cigar"
+
+
+def test_pack_words(tmp_path):
+    from ._packed import PackedWordList, pack_words
+
+    path = str(tmp_path / "words.bin")
+    pack_words(["bread", "cigar"], path)
+    assert PackedWordList(path).words() == ["bread", "cigar"]
+
+    pack_words([], path)
+    assert len(PackedWordList(path)) == 0
+
+
+def test_vocabulary_is_cached_and_immutable():
+    assert get_valid_wordle_words() is get_valid_wordle_words()
+    assert get_valid_scrabble_words() is get_valid_scrabble_words()
+    assert isinstance(get_valid_wordle_words(), frozenset)
+    assert isinstance(get_valid_scrabble_words(), tuple)
+
+
+def test_register_valid_words():
+    from . import _clear_vocabulary_caches, _custom_valid_words, register_valid_words
+
+    before = get_valid_wordle_words()
+    try:
+        register_valid_words(["zzzzq"])
+        assert "zzzzq" in get_valid_wordle_words()
+        assert "zzzzq" not in before
+        assert get_valid_wordle_words() is not before
+        assert get_word_table().is_valid[get_word_table().id_of("zzzzq")]
+
+        with pytest.raises(ValueError):
+            register_valid_words(["toolong"])
+    finally:
+        _custom_valid_words.clear()
+        _clear_vocabulary_caches()
+    assert get_valid_wordle_words() == before